@@ -8,26 +8,38 @@ The supported input formats include Leica LIF, Nikon ND2, Zeiss CZI, and TIFF-ba
 """
 
 import concurrent.futures
+import contextlib
+import functools
 import os
+import queue
 import re
 import shutil
+import sqlite3
+import sys
+import threading
+import time
+from math import prod
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import dask.array as da
 import napari
 import nd2  # https://github.com/tlambert03/nd2
+import numcodecs
 import numpy as np
 import tifffile
 import zarr
-from dask.diagnostics import ProgressBar
 from magicgui import magicgui
 from ome_zarr.io import parse_url
-from ome_zarr.writer import write_image
 from pylibCZIrw import czi  # https://github.com/ZEISS/pylibczirw
-from qtpy.QtCore import Qt, QThread, Signal
+from qtpy.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    Qt,
+    QThread,
+    Signal,
+)
 from qtpy.QtWidgets import (
-    QApplication,
     QCheckBox,
     QComboBox,
     QFileDialog,
@@ -38,8 +50,7 @@ from qtpy.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -50,19 +61,461 @@ from readlif.reader import (
 )
 from tiffslide import TiffSlide  # https://github.com/Bayer-Group/tiffslide
 
+# Optional io_uring support for batched chunk writes (Linux only)
+try:
+    import liburing  # https://github.com/YoSTEALTH/Liburing
+
+    HAS_LIBURING = sys.platform == "linux"
+except ImportError:
+    HAS_LIBURING = False
+
+# Maximum number of threads used for concurrent frame reads
+_MAX_THREADS = 8
+
+# Minimum seconds between progress signal emissions from worker threads;
+# each cross-thread emit allocates a queued event and wakes the GUI loop
+_PROGRESS_INTERVAL = 0.05
+
+# Default Zarr chunk compressor: byte-shuffled LZ4. The shuffle groups
+# the high and low bytes of 16-bit microscopy samples, which LZ4 then
+# compresses at a far better ratio for almost no extra CPU
+_ZARR_COMPRESSOR = numcodecs.Blosc(
+    cname="lz4", clevel=5, shuffle=numcodecs.Blosc.SHUFFLE
+)
+
+
+class _ReaderCache:
+    """LRU cache of open reader handles keyed by file path.
+
+    Probing a file's series count and later loading a series otherwise
+    open (and header-parse) the same file twice; keeping the handle
+    alive between the two halves that cost. Bounded because every entry
+    pins an OS file handle: the least recently used reader is closed on
+    eviction. Safe to call from the GUI and worker threads.
+    """
+
+    def __init__(self, open_func, maxsize: int = 16):
+        self._open = open_func
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._readers: Dict[str, object] = {}  # insertion order == LRU
+
+    def __call__(self, filepath: str):
+        with self._lock:
+            reader = self._readers.pop(filepath, None)
+            if reader is not None:
+                # Reinsert to mark as most recently used
+                self._readers[filepath] = reader
+                return reader
+
+        reader = self._open(filepath)
+
+        with self._lock:
+            existing = self._readers.get(filepath)
+            if existing is not None:
+                # Another thread opened the same file first; keep the
+                # established handle and discard ours
+                self._close(reader)
+                return existing
+
+            self._readers[filepath] = reader
+            while len(self._readers) > self._maxsize:
+                oldest = next(iter(self._readers))
+                self._close(self._readers.pop(oldest))
+        return reader
+
+    @staticmethod
+    def _close(reader):
+        with contextlib.suppress(AttributeError, OSError, ValueError):
+            reader.close()
+
+    def _close_all(self):
+        with self._lock:
+            for reader in self._readers.values():
+                self._close(reader)
+            self._readers.clear()
+
+
+def _advise_sequential(path: str):
+    """Hint the kernel that a file is about to be read sequentially.
+
+    posix_fadvise(SEQUENTIAL | WILLNEED) widens the readahead window
+    and starts it immediately, which helps the multi-gigabyte linear
+    reads the format readers do, especially on spinning disks and
+    network filesystems. The advice sticks to the cached inode, so it
+    benefits the reader's own subsequent open. No-op where unsupported.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(
+            fd, 0, 0, os.POSIX_FADV_SEQUENTIAL | os.POSIX_FADV_WILLNEED
+        )
+    finally:
+        os.close(fd)
+
+
+def _open_lif_reader(filepath: str) -> LifFile:
+    """Open a LIF reader; header parsing is expensive"""
+    _advise_sequential(filepath)
+    return LifFile(filepath)
+
+
+def _open_nd2_reader(filepath: str):
+    """Open an ND2 reader"""
+    _advise_sequential(filepath)
+    return nd2.ND2File(filepath)
+
+
+def _open_tiffslide_reader(filepath: str) -> TiffSlide:
+    """Open a TiffSlide reader"""
+    _advise_sequential(filepath)
+    return TiffSlide(filepath)
+
+
+_open_lif = _ReaderCache(_open_lif_reader)
+_open_nd2 = _ReaderCache(_open_nd2_reader)
+_open_tiffslide = _ReaderCache(_open_tiffslide_reader)
+
+
+@functools.lru_cache(maxsize=2)
+def _cached_load_series(loader, filepath: str, series_index: int):
+    """Memoize the most recently previewed series.
+
+    Toggling between two series of a large CZI/ND2 in the preview
+    otherwise rereads and redecodes the file on every click. Kept tiny
+    (two entries) since entries can be multi-GB arrays; cleared on each
+    folder rescan.
+    """
+    return loader.load_series(filepath, series_index)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_czi_info(filepath: str) -> Dict:
+    """Read every CZI field the loader needs in a single open.
+
+    pylibczirw handles must not outlive their context, so the extracted
+    values are cached here rather than the open reader itself.
+    """
+    _advise_sequential(filepath)
+    with czi.open_czi(filepath) as czi_file:
+        return {
+            "scenes": dict(czi_file.scenes_bounding_rectangle),
+            "total_bounding_box": dict(czi_file.total_bounding_box),
+            "raw_metadata": czi_file.raw_metadata,
+            "scale_x": czi_file.scale_x,
+            "scale_y": czi_file.scale_y,
+            "scale_z": czi_file.scale_z,
+        }
+
+
+def close_cached_readers():
+    """Close all cached file readers and drop the caches"""
+    _open_lif._close_all()
+    _open_nd2._close_all()
+    _open_tiffslide._close_all()
+    _read_czi_info.cache_clear()
+
+
+# io_uring submission queue depth for batched chunk writes
+_IOURING_QUEUE_DEPTH = 256
+
+
+class _IoUringBatchEngine:
+    """Batches small file writes through a single io_uring submission ring.
+
+    Zarr chunk writes are many small synchronous write() syscalls; queuing
+    them as a batch of SQEs and submitting once amortizes the syscall and
+    context-switch cost.
+    """
+
+    def __init__(self, depth: int = _IOURING_QUEUE_DEPTH):
+        self.depth = depth
+        self._pending: Dict[str, bytes] = {}  # path -> payload
+
+    def enqueue(self, path: str, data: bytes):
+        self._pending[path] = data
+        if len(self._pending) >= self.depth:
+            self.flush()
+
+    def peek(self, path: str) -> Optional[bytes]:
+        """Return the queued payload for a path, if any"""
+        return self._pending.get(path)
+
+    def discard(self, path: str):
+        """Drop a queued payload without writing it"""
+        self._pending.pop(path, None)
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        # Open every target first: a failing open raises here, before
+        # anything is submitted, with the queue intact — no other chunk
+        # gets silently dropped
+        fds = []
+        writes = []  # [path, fd, payload, bytes written so far]
+        try:
+            for path, data in self._pending.items():
+                fd = os.open(
+                    path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666
+                )
+                fds.append(fd)
+                writes.append([path, fd, data, 0])
+
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(self.depth, ring)
+            try:
+                # One submission per round; short writes are resubmitted
+                # from their new offset until every payload is on disk
+                while writes:
+                    for index, (_path, fd, data, done) in enumerate(writes):
+                        sqe = liburing.io_uring_get_sqe(ring)
+                        liburing.io_uring_prep_write(
+                            sqe, fd, data[done:], len(data) - done, done
+                        )
+                        sqe.user_data = index
+                    liburing.io_uring_submit_and_wait(ring, len(writes))
+
+                    cqe = liburing.io_uring_cqe()
+                    results = {}
+                    for _ in writes:
+                        liburing.io_uring_wait_cqe(ring, cqe)
+                        results[cqe.user_data] = cqe.res
+                        liburing.io_uring_cqe_seen(ring, cqe)
+
+                    incomplete = []
+                    for index, write in enumerate(writes):
+                        path, _fd, data, done = write
+                        res = results[index]
+                        if res < 0:
+                            raise OSError(-res, os.strerror(-res), path)
+                        if res == 0:
+                            raise OSError(f"io_uring wrote 0 bytes to {path}")
+                        done += res
+                        if done < len(data):
+                            write[3] = done
+                            incomplete.append(write)
+                    writes = incomplete
+            finally:
+                liburing.io_uring_queue_exit(ring)
+
+            self._pending.clear()
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+
+class IoUringDirectoryStore(zarr.storage.DirectoryStore):
+    """DirectoryStore that batches chunk writes through io_uring.
+
+    Metadata keys (.zarray, .zgroup, .zattrs) are written synchronously so
+    readers always see a consistent store; only bulk chunk data goes
+    through the batch engine. Reads and deletes consult the pending
+    queue first, so zarr's read-modify-write of a partially covered
+    chunk (routine when dask blocks do not align with the chunk grid)
+    sees queued bytes that have not hit the disk yet. Callers must
+    flush() once writing is done.
+    """
+
+    def __init__(self, path, **kwargs):
+        super().__init__(path, **kwargs)
+        self._engine = _IoUringBatchEngine()
+
+    def _chunk_path(self, key) -> str:
+        return os.path.join(self.path, *key.split("/"))
+
+    def __setitem__(self, key, value):
+        if os.path.basename(key).startswith("."):
+            super().__setitem__(key, value)
+            return
+
+        file_path = self._chunk_path(key)
+        dir_path = os.path.dirname(file_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        self._engine.enqueue(file_path, bytes(value))
+
+    def __getitem__(self, key):
+        pending = self._engine.peek(self._chunk_path(key))
+        if pending is not None:
+            return pending
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if self._engine.peek(self._chunk_path(key)) is not None:
+            return True
+        return super().__contains__(key)
+
+    def __delitem__(self, key):
+        file_path = self._chunk_path(key)
+        if self._engine.peek(file_path) is not None:
+            self._engine.discard(file_path)
+            # Also drop any previously flushed copy on disk
+            with contextlib.suppress(KeyError):
+                super().__delitem__(key)
+            return
+        super().__delitem__(key)
+
+    def flush(self):
+        self._engine.flush()
+
+
+# Upper bound on bytes read per prefetch batch so scratch buffers stay
+# modest even for TIFFs with very large strips
+_PREFETCH_BATCH_BYTES = 64 * 1024**2
+
+
+def _read_batch_iouring(fd: int, batch: List[Tuple[int, int]]):
+    """Read a batch of (offset, length) extents via one ring submission"""
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(len(batch), ring)
+    try:
+        buffers = []
+        for offset, length in batch:
+            buf = bytearray(length)
+            buffers.append(buf)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buf, length, offset)
+
+        liburing.io_uring_submit_and_wait(ring, len(batch))
+        cqe = liburing.io_uring_cqe()
+        for _ in batch:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+def _prefetch_tiff_pages(filepath: str):
+    """Pull a TIFF's page data into the page cache ahead of decoding.
+
+    The (offset, length) extents come straight from the IFDs. With
+    liburing available they are read in batches of SQEs submitted
+    together — one syscall per batch instead of one pread per page —
+    and the scratch buffers are dropped immediately, leaving the data
+    hot in the page cache for the real decode. Without liburing each
+    extent gets a POSIX_FADV_WILLNEED hint instead.
+    """
+    try:
+        with tifffile.TiffFile(filepath) as tif:
+            extents = [
+                (page.dataoffsets[0], sum(page.databytecounts))
+                for page in tif.pages
+                if page.dataoffsets
+            ]
+    except (ValueError, OSError):
+        return
+    if not extents:
+        return
+
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if HAS_LIBURING:
+            batch = []
+            batch_bytes = 0
+            for offset, length in extents:
+                batch.append((offset, length))
+                batch_bytes += length
+                if (
+                    len(batch) >= _IOURING_QUEUE_DEPTH
+                    or batch_bytes >= _PREFETCH_BATCH_BYTES
+                ):
+                    _read_batch_iouring(fd, batch)
+                    batch = []
+                    batch_bytes = 0
+            if batch:
+                _read_batch_iouring(fd, batch)
+        elif hasattr(os, "posix_fadvise"):
+            for offset, length in extents:
+                os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+class _FileTableModel(QAbstractTableModel):
+    """Model behind SeriesTableWidget: rows are (filepath, series_count)"""
+
+    _HEADERS = ("Original Files", "Series")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, int]] = []
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._rows)
 
-class SeriesTableWidget(QTableWidget):
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        filepath, series_count = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return os.path.basename(filepath)
+            return (
+                f"{series_count} series"
+                if series_count >= 0
+                else "Not a series file"
+            )
+        if role == Qt.UserRole and index.column() == 0:
+            return filepath
+        return None
+
+    def filepath_at(self, row: int) -> str:
+        return self._rows[row][0]
+
+    def append_rows(self, rows: List[Tuple[str, int]]):
+        """Insert a batch of rows with a single model notification"""
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class SeriesTableWidget(QTableView):
     """
-    Custom table widget to display original files and their series
+    Custom table view to display original files and their series.
+
+    Rows live in a QAbstractTableModel and are inserted in batches, so
+    large scans avoid the per-row item creation and relayout that makes
+    QTableWidget quadratic in the number of files.
     """
 
+    _BATCH_SIZE = 100
+
     def __init__(self, viewer: napari.Viewer):
         super().__init__()
         self.viewer = viewer
 
         # Configure table
-        self.setColumnCount(2)
-        self.setHorizontalHeaderLabels(["Original Files", "Series"])
+        self._model = _FileTableModel(self)
+        self.setModel(self._model)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         # Track file mappings
@@ -70,31 +523,20 @@ class SeriesTableWidget(QTableWidget):
             {}
         )  # {filepath: {type: file_type, series: [list_of_series]}}
 
+        # Rows waiting to be inserted into the model
+        self._pending_rows = []
+        self._last_flush = 0.0
+
         # Currently loaded images
         self.current_file = None
         self.current_series = None
 
         # Connect selection signals
-        self.cellClicked.connect(self.handle_cell_click)
+        self.clicked.connect(self.handle_cell_click)
 
     def add_file(self, filepath: str, file_type: str, series_count: int):
         """Add a file to the table with series information"""
-        row = self.rowCount()
-        self.insertRow(row)
-
-        # Original file item
-        original_item = QTableWidgetItem(os.path.basename(filepath))
-        original_item.setData(Qt.UserRole, filepath)
-        self.setItem(row, 0, original_item)
-
-        # Series info
-        series_info = (
-            f"{series_count} series"
-            if series_count >= 0
-            else "Not a series file"
-        )
-        series_item = QTableWidgetItem(series_info)
-        self.setItem(row, 1, series_item)
+        row = len(self._model._rows) + len(self._pending_rows)
 
         # Store file info
         self.file_data[filepath] = {
@@ -103,24 +545,74 @@ class SeriesTableWidget(QTableWidget):
             "row": row,
         }
 
-    def handle_cell_click(self, row: int, column: int):
+        self._pending_rows.append((filepath, series_count))
+        # Flush on size or on time, so short scans show rows promptly
+        # instead of waiting for the batch to fill
+        if (
+            len(self._pending_rows) >= self._BATCH_SIZE
+            or time.monotonic() - self._last_flush >= _PROGRESS_INTERVAL
+        ):
+            self.flush_pending()
+
+    def flush_pending(self):
+        """Insert any queued rows into the model as one batch"""
+        self._last_flush = time.monotonic()
+        if self._pending_rows:
+            self._model.append_rows(self._pending_rows)
+            self._pending_rows = []
+
+    def clear_files(self):
+        """Remove all rows and file mappings"""
+        self._pending_rows = []
+        self._model.clear()
+        self.file_data.clear()
+
+    def handle_cell_click(self, index):
         """Handle cell click to show series details or load image"""
-        if column == 0:
-            # Get filepath from the clicked cell
-            item = self.item(row, 0)
-            if item:
-                filepath = item.data(Qt.UserRole)
-                file_info = self.file_data.get(filepath)
-
-                if file_info and file_info["series_count"] > 0:
-                    # Update the current file
-                    self.current_file = filepath
-
-                    # Signal to show series details
-                    self.parent().show_series_details(filepath)
-                else:
-                    # Not a series file, just load the image
-                    self.parent().load_image(filepath)
+        if index.column() == 0:
+            filepath = self._model.filepath_at(index.row())
+            file_info = self.file_data.get(filepath)
+
+            if file_info and file_info["series_count"] > 0:
+                # Update the current file
+                self.current_file = filepath
+
+                # Signal to show series details
+                self.parent().show_series_details(filepath)
+            else:
+                # Not a series file, just load the image
+                self.parent().load_image(filepath)
+
+
+class SeriesPreviewWorker(QThread):
+    """Worker thread that loads a series off the GUI thread.
+
+    nd2/czi/readlif release the GIL inside their native readers, so the
+    event loop stays responsive while the (potentially multi-GB) series
+    is decoded.
+    """
+
+    loaded = Signal(object, object)  # image_data, metadata
+    error = Signal(str)
+
+    def __init__(self, loader, filepath: str, series_index: int):
+        super().__init__()
+        self.loader = loader
+        self.filepath = filepath
+        self.series_index = series_index
+
+    def run(self):
+        try:
+            # First get metadata to understand dimensions
+            metadata = self.loader.get_metadata(
+                self.filepath, self.series_index
+            )
+            image_data = _cached_load_series(
+                self.loader, self.filepath, self.series_index
+            )
+            self.loaded.emit(image_data, metadata)
+        except (ValueError, FileNotFoundError) as e:
+            self.error.emit(str(e))
 
 
 class SeriesDetailWidget(QWidget):
@@ -132,6 +624,7 @@ class SeriesDetailWidget(QWidget):
         self.viewer = viewer
         self.current_file = None
         self.max_series = 0
+        self._preview_worker = None
 
         # Create layout
         layout = QVBoxLayout()
@@ -202,22 +695,18 @@ class SeriesDetailWidget(QWidget):
                     file_type = self.parent.get_file_type(filepath)
                     if file_type == "ND2":
                         try:
-                            with nd2.ND2File(filepath) as nd2_file:
-                                dims = dict(nd2_file.sizes)
-                                pixel_size = nd2_file.dtype.itemsize
-                                total_elements = np.prod(
-                                    [dims[dim] for dim in dims]
-                                )
-                                size_GB = (total_elements * pixel_size) / (
-                                    1024**3
-                                )
-
-                                self.info_label.setText(
-                                    f"File contains {series_count} series (size: {size_GB:.2f}GB)"
-                                )
-
-                                # Update format buttons
-                                self.parent.update_format_buttons(size_GB > 4)
+                            nd2_file = _open_nd2(filepath)
+                            dims = dict(nd2_file.sizes)
+                            pixel_size = nd2_file.dtype.itemsize
+                            total_elements = prod(dims.values())
+                            size_GB = (total_elements * pixel_size) / (1024**3)
+
+                            self.info_label.setText(
+                                f"File contains {series_count} series (size: {size_GB:.2f}GB)"
+                            )
+
+                            # Update format buttons
+                            self.parent.update_format_buttons(size_GB > 4)
                         except (ValueError, FileNotFoundError) as e:
                             print(f"Error estimating file size: {e}")
             except FileNotFoundError:
@@ -257,16 +746,14 @@ class SeriesDetailWidget(QWidget):
 
                     # For ND2 files, we can directly check the size
                     if self.parent.get_file_type(self.current_file) == "ND2":
-                        with nd2.ND2File(self.current_file) as nd2_file:
-                            dims = dict(nd2_file.sizes)
-                            pixel_size = nd2_file.dtype.itemsize
-                            total_elements = np.prod(
-                                [dims[dim] for dim in dims]
-                            )
-                            size_GB = (total_elements * pixel_size) / (1024**3)
-
-                            # Automatically set the appropriate radio button based on size
-                            self.parent.update_format_buttons(size_GB > 4)
+                        nd2_file = _open_nd2(self.current_file)
+                        dims = dict(nd2_file.sizes)
+                        pixel_size = nd2_file.dtype.itemsize
+                        total_elements = prod(dims.values())
+                        size_GB = (total_elements * pixel_size) / (1024**3)
+
+                        # Automatically set the appropriate radio button based on size
+                        self.parent.update_format_buttons(size_GB > 4)
                 except (ValueError, FileNotFoundError) as e:
                     print(f"Error estimating file size: {e}")
 
@@ -284,42 +771,57 @@ class SeriesDetailWidget(QWidget):
                 )
                 return
 
+            # Dropping the reference to a running QThread destroys it
+            # mid-flight and crashes; ignore clicks until the current
+            # load has delivered its result
+            if (
+                self._preview_worker is not None
+                and self._preview_worker.isRunning()
+            ):
+                self.viewer.status = "Still loading previous series..."
+                return
+
             file_loader = self.parent.get_file_loader(self.current_file)
 
-            try:
-                # First get metadata to understand dimensions
-                metadata = file_loader.get_metadata(
-                    self.current_file, series_index
-                )
+            # Load in a worker thread so the GUI thread is not blocked;
+            # the result is delivered back via a queued signal
+            self.viewer.status = f"Loading {Path(self.current_file).name} - Series {series_index}..."
+            self._preview_worker = SeriesPreviewWorker(
+                file_loader, self.current_file, series_index
+            )
+            self._preview_worker.loaded.connect(self._display_preview)
+            self._preview_worker.error.connect(self._preview_failed)
+            self._preview_worker.start()
+
+    def _display_preview(self, image_data, metadata):
+        """Show a loaded series in the viewer (runs on the GUI thread)"""
+        series_index = self.series_selector.itemData(
+            self.series_selector.currentIndex()
+        )
 
-                # Load the series
-                image_data = file_loader.load_series(
-                    self.current_file, series_index
-                )
+        # Reorder dimensions for Napari based on metadata
+        if metadata and "axes" in metadata:
+            print(f"File has dimension order: {metadata['axes']}")
+            # Target dimension order for Napari
+            napari_order = "CTZYX"[: len(image_data.shape)]
+            image_data = self._reorder_dimensions(
+                image_data, metadata, napari_order
+            )
 
-                # Reorder dimensions for Napari based on metadata
-                if metadata and "axes" in metadata:
-                    print(f"File has dimension order: {metadata['axes']}")
-                    # Target dimension order for Napari
-                    napari_order = "CTZYX"[: len(image_data.shape)]
-                    image_data = self._reorder_dimensions(
-                        image_data, metadata, napari_order
-                    )
+        # Clear existing layers and display the image
+        self.viewer.layers.clear()
+        self.viewer.add_image(
+            image_data,
+            name=f"{Path(self.current_file).stem} - Series {series_index}",
+        )
 
-                # Clear existing layers and display the image
-                self.viewer.layers.clear()
-                self.viewer.add_image(
-                    image_data,
-                    name=f"{Path(self.current_file).stem} - Series {series_index}",
-                )
+        # Update status
+        self.viewer.status = f"Previewing {Path(self.current_file).name} - Series {series_index}"
 
-                # Update status
-                self.viewer.status = f"Previewing {Path(self.current_file).name} - Series {series_index}"
-            except (ValueError, FileNotFoundError) as e:
-                self.viewer.status = f"Error loading series: {str(e)}"
-                QMessageBox.warning(
-                    self, "Error", f"Could not load series: {str(e)}"
-                )
+    def _preview_failed(self, message):
+        """Report a failed preview load (runs on the GUI thread)"""
+        self.viewer.status = f"Error loading series: {message}"
+        QMessageBox.warning(self, "Error", f"Could not load series: {message}")
 
     def _reorder_dimensions(self, image_data, metadata, target_order="YXZTC"):
         """Reorder dimensions based on metadata axes information
@@ -413,47 +915,84 @@ class LIFLoader(FormatLoader):
     @staticmethod
     def get_series_count(filepath: str) -> int:
         try:
-            lif_file = LifFile(filepath)
+            lif_file = _open_lif(filepath)
             # Directly use the iterator, no need to load all images into a list
             return sum(1 for _ in lif_file.get_iter_image())
         except (ValueError, FileNotFoundError):
             return 0
 
+    @staticmethod
+    def _series_layout(image) -> Tuple[str, Tuple[int, ...]]:
+        """Axes and shape of a series with singleton dimensions dropped.
+
+        Y and X are always kept, so callers can rely on the returned axes
+        string to label the array instead of squeezing after the fact.
+        """
+        x_dim, y_dim = image.dims[0], image.dims[1]
+        dims = (
+            ("T", image.nt),
+            ("Z", image.nz),
+            ("C", image.channels),
+        )
+        axes = "".join(ax for ax, size in dims if size > 1) + "YX"
+        shape = tuple(size for _ax, size in dims if size > 1) + (y_dim, x_dim)
+        return axes, shape
+
     @staticmethod
     def load_series(filepath: str, series_index: int) -> np.ndarray:
-        lif_file = LifFile(filepath)
+        lif_file = _open_lif(filepath)
         image = lif_file.get_image(series_index)
 
         # Extract dimensions
         channels = image.channels
         z_stacks = image.nz
         timepoints = image.nt
-        x_dim, y_dim = image.dims[0], image.dims[1]
 
-        # Create an array to hold the entire series
-        series_shape = (
-            timepoints,
-            z_stacks,
-            channels,
-            y_dim,
-            x_dim,
-        )  # Corrected shape
-        series_data = np.zeros(series_shape, dtype=np.uint16)
-
-        # Populate the array
+        # Allocate only the surviving axes upfront instead of squeezing a
+        # full 5-D array afterwards; downstream axis labeling follows the
+        # same rule (see _series_layout)
+        _axes, series_shape = LIFLoader._series_layout(image)
+        # np.empty skips the upfront zeroing pass over the (often multi-GB)
+        # array; every plane is either overwritten or zeroed on miss below
+        series_data = np.empty(series_shape, dtype=np.uint16)
+
+        # Fetch frames concurrently; readlif releases the GIL during file
+        # reads, so a thread pool turns the serial per-plane reads into
+        # concurrent ones. One task per (t, z) fetches all channels through
+        # get_iter_c, cutting the Python dispatch overhead by channels-x.
+        # Each future writes into a disjoint slice of the preallocated
+        # array, so no locking is needed.
         missing_frames = 0
-        for t in range(timepoints):
-            for z in range(z_stacks):
-                for c in range(channels):
-                    # Get the frame and convert to numpy array
-                    frame = image.get_frame(z=z, t=t, c=c)
-                    if frame:
-                        series_data[t, z, c, :, :] = np.array(frame)
-                    else:
-                        missing_frames += 1
-                        series_data[t, z, c, :, :] = np.zeros(
-                            (y_dim, x_dim), dtype=np.uint16
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_MAX_THREADS
+        ) as executor:
+            futures = {
+                executor.submit(list, image.get_iter_c(t=t, z=z)): (t, z)
+                for t in range(timepoints)
+                for z in range(z_stacks)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                t, z = futures[future]
+                frames = future.result()
+                # Index only the surviving (non-singleton) axes
+                prefix = tuple(
+                    value
+                    for value, size in ((t, timepoints), (z, z_stacks))
+                    if size > 1
+                )
+                for c, frame in enumerate(frames):
+                    index = prefix + ((c,) if channels > 1 else ())
+                    # np.asarray goes through PIL's buffer protocol, so the
+                    # assignment into series_data is the only pixel copy
+                    series_data[index] = np.asarray(frame)
+                if len(frames) < channels:
+                    missing_frames += channels - len(frames)
+                    if channels > 1:
+                        series_data[prefix + (slice(len(frames), None),)].fill(
+                            0
                         )
+                    else:
+                        series_data[prefix].fill(0)
 
         if missing_frames > 0:
             print(
@@ -462,22 +1001,41 @@ class LIFLoader(FormatLoader):
 
         return series_data
 
+    @staticmethod
+    def get_series_shape(filepath: str, series_index: int) -> Tuple[int, ...]:
+        """Return the (T, Z, C, Y, X) shape of a series without loading it"""
+        lif_file = _open_lif(filepath)
+        image = lif_file.get_image(series_index)
+        x_dim, y_dim = image.dims[0], image.dims[1]
+        return (image.nt, image.nz, image.channels, y_dim, x_dim)
+
+    @staticmethod
+    def iter_planes(filepath: str, series_index: int):
+        """Yield ((t, z, c), plane) pairs one decoded 2-D plane at a time.
+
+        Lets callers stream a series into an on-disk store while keeping
+        only a single plane in memory, instead of materializing the full
+        (T, Z, C, Y, X) array. Missing frames are skipped.
+        """
+        lif_file = _open_lif(filepath)
+        image = lif_file.get_image(series_index)
+
+        for t in range(image.nt):
+            for z in range(image.nz):
+                for c, frame in enumerate(image.get_iter_c(t=t, z=z)):
+                    yield (t, z, c), np.asarray(frame)
+
     @staticmethod
     def get_metadata(filepath: str, series_index: int) -> Dict:
         try:
-            lif_file = LifFile(filepath)
+            lif_file = _open_lif(filepath)
             image = lif_file.get_image(series_index)
-            axes = "".join(image.dims._fields).upper()
-            channels = image.channels
-            if channels > 1:
-                # add C to end of string
-                axes += "C"
+            # Same singleton-dropping rule as load_series, so the axes
+            # string always matches the returned array's dimensions
+            axes, _shape = LIFLoader._series_layout(image)
 
             metadata = {
-                # "channels": image.channels,
-                # "z_stacks": image.nz,
-                # "timepoints": image.nt,
-                "axes": "TZCYX",
+                "axes": axes,
                 "unit": "um",
                 "resolution": image.scale[:2],
             }
@@ -505,18 +1063,16 @@ class ND2Loader(FormatLoader):
         if series_index != 0:
             raise ValueError("ND2 files only support series index 0")
 
-        # First open the file to check metadata
-        with nd2.ND2File(filepath) as nd2_file:
-            # Calculate size in GB
-            total_size = np.prod(
-                [nd2_file.sizes[dim] for dim in nd2_file.sizes]
-            )
-            pixel_size = nd2_file.dtype.itemsize
-            size_GB = (total_size * pixel_size) / (1024**3)
+        # Check metadata first through the cached reader
+        nd2_file = _open_nd2(filepath)
+        # Calculate size in GB
+        total_size = prod(nd2_file.sizes.values())
+        pixel_size = nd2_file.dtype.itemsize
+        size_GB = (total_size * pixel_size) / (1024**3)
 
-            print(f"ND2 file dimensions: {nd2_file.sizes}")
-            print(f"Pixel type: {nd2_file.dtype}, size: {pixel_size} bytes")
-            print(f"Estimated file size: {size_GB:.2f} GB")
+        print(f"ND2 file dimensions: {nd2_file.sizes}")
+        print(f"Pixel type: {nd2_file.dtype}, size: {pixel_size} bytes")
+        print(f"Estimated file size: {size_GB:.2f} GB")
 
         if size_GB > 4:
             print("Using Dask for large file")
@@ -534,104 +1090,127 @@ class ND2Loader(FormatLoader):
         if series_index != 0:
             return {}
 
-        with nd2.ND2File(filepath) as nd2_file:
-            # Get all dimensions and their sizes
-            dims = dict(nd2_file.sizes)
+        nd2_file = _open_nd2(filepath)
 
-            # Create a more detailed axes representation
-            axes = "".join(dims.keys())
+        # Get all dimensions and their sizes
+        dims = dict(nd2_file.sizes)
 
-            print(f"ND2 metadata - dims: {dims}")
-            print(f"ND2 metadata - axes: {axes}")
+        # Create a more detailed axes representation
+        axes = "".join(dims.keys())
 
-            # Get spatial dimensions and convert to resolution
-            try:
-                voxel = nd2_file.voxel_size()
-                x_res = 1 / voxel.x if voxel.x > 0 else 1.0
-                y_res = 1 / voxel.y if voxel.y > 0 else 1.0
-                z_spacing = 1 / voxel.z if voxel.z > 0 else 1.0
-
-                print(f"Voxel size: x={voxel.x}, y={voxel.y}, z={voxel.z}")
-            except (ValueError, AttributeError) as e:
-                print(f"Error getting voxel size: {e}")
-                x_res, y_res, z_spacing = 1.0, 1.0, 1.0
-
-            # Create scale information for all dimensions
-            scales = {}
-            if "T" in dims:
-                scales["scale_t"] = 1.0
-            if "Z" in dims:
-                scales["scale_z"] = z_spacing
-            if "C" in dims:
-                scales["scale_c"] = 1.0
-            if "Y" in dims:
-                scales["scale_y"] = y_res
-            if "X" in dims:
-                scales["scale_x"] = x_res
-
-            # Build comprehensive metadata
-            metadata = {
-                "axes": axes,
-                "dimensions": dims,
-                "resolution": (x_res, y_res),
-                "unit": "um",
-                "spacing": z_spacing,
-                **scales,  # Add all scale information
-            }
+        print(f"ND2 metadata - dims: {dims}")
+        print(f"ND2 metadata - axes: {axes}")
 
-            # Add extra metadata for zarr transformations
-            ordered_scales = []
-            for ax in axes:
-                scale_key = f"scale_{ax.lower()}"
-                ordered_scales.append(scales.get(scale_key, 1.0))
+        # Get spatial dimensions and convert to resolution
+        try:
+            voxel = nd2_file.voxel_size()
+            x_res = 1 / voxel.x if voxel.x > 0 else 1.0
+            y_res = 1 / voxel.y if voxel.y > 0 else 1.0
+            z_spacing = 1 / voxel.z if voxel.z > 0 else 1.0
+
+            print(f"Voxel size: x={voxel.x}, y={voxel.y}, z={voxel.z}")
+        except (ValueError, AttributeError) as e:
+            print(f"Error getting voxel size: {e}")
+            x_res, y_res, z_spacing = 1.0, 1.0, 1.0
+
+        # Create scale information for all dimensions
+        scales = {}
+        if "T" in dims:
+            scales["scale_t"] = 1.0
+        if "Z" in dims:
+            scales["scale_z"] = z_spacing
+        if "C" in dims:
+            scales["scale_c"] = 1.0
+        if "Y" in dims:
+            scales["scale_y"] = y_res
+        if "X" in dims:
+            scales["scale_x"] = x_res
+
+        # Build comprehensive metadata
+        metadata = {
+            "axes": axes,
+            "dimensions": dims,
+            "resolution": (x_res, y_res),
+            "unit": "um",
+            "spacing": z_spacing,
+            **scales,  # Add all scale information
+        }
 
-            metadata["scales"] = ordered_scales
+        # Add extra metadata for zarr transformations
+        ordered_scales = []
+        for ax in axes:
+            scale_key = f"scale_{ax.lower()}"
+            ordered_scales.append(scales.get(scale_key, 1.0))
 
-            return metadata
+        metadata["scales"] = ordered_scales
+
+        return metadata
 
 
 class TIFFSlideLoader(FormatLoader):
     """Loader for whole slide TIFF images (NDPI, etc.)"""
 
+    # Whole-slide formats go through TiffSlide; plain TIFFs are routed
+    # straight to tifffile so they skip the pyramid parse entirely
+    _SLIDE_EXTENSIONS = (".ndpi", ".svs", ".scn", ".mrxs")
+    _TIFF_EXTENSIONS = (".tif", ".tiff")
+
+    @staticmethod
+    def _is_plain_tiff(filepath: str) -> bool:
+        return filepath.lower().endswith(TIFFSlideLoader._TIFF_EXTENSIONS)
+
     @staticmethod
     def can_load(filepath: str) -> bool:
-        ext = filepath.lower()
-        return ext.endswith(".ndpi")
+        return filepath.lower().endswith(
+            TIFFSlideLoader._SLIDE_EXTENSIONS
+            + TIFFSlideLoader._TIFF_EXTENSIONS
+        )
+
+    @staticmethod
+    def _count_tiff_series(filepath: str) -> int:
+        # _useframes keeps uniform stacks as lightweight frames instead
+        # of parsing every IFD, so counting stays cheap on files with
+        # tens of thousands of pages
+        with tifffile.TiffFile(filepath, _useframes=True) as tif:
+            return len(tif.series)
 
     @staticmethod
     def get_series_count(filepath: str) -> int:
+        if TIFFSlideLoader._is_plain_tiff(filepath):
+            try:
+                return TIFFSlideLoader._count_tiff_series(filepath)
+            except (ValueError, FileNotFoundError):
+                return 0
+
         try:
-            with TiffSlide(filepath) as slide:
-                # NDPI typically has a main image and several levels (pyramid)
-                return len(slide.level_dimensions)
+            slide = _open_tiffslide(filepath)
+            # NDPI typically has a main image and several levels (pyramid)
+            return len(slide.level_dimensions)
         except (ValueError, FileNotFoundError):
             # Try standard tifffile if TiffSlide fails
             try:
-                with tifffile.TiffFile(filepath) as tif:
-                    return len(tif.series)
+                return TIFFSlideLoader._count_tiff_series(filepath)
             except (ValueError, FileNotFoundError):
                 return 0
 
     @staticmethod
     def load_series(filepath: str, series_index: int) -> np.ndarray:
-        try:
-            # First try TiffSlide for whole slide images
-            with TiffSlide(filepath) as slide:
-                if series_index < 0 or series_index >= len(
-                    slide.level_dimensions
-                ):
+        if TIFFSlideLoader._is_plain_tiff(filepath):
+            _advise_sequential(filepath)
+            _prefetch_tiff_pages(filepath)
+            with tifffile.TiffFile(filepath) as tif:
+                if series_index < 0 or series_index >= len(tif.series):
                     raise ValueError(
                         f"Series index {series_index} out of range"
                     )
 
-                # Get dimensions for the level
-                width, height = slide.level_dimensions[series_index]
-                # Read the entire level
-                return np.array(
-                    slide.read_region((0, 0), series_index, (width, height))
-                )
+                return tif.series[series_index].asarray()
+
+        try:
+            slide = _open_tiffslide(filepath)
+            level_count = len(slide.level_dimensions)
         except (ValueError, FileNotFoundError):
-            # Fall back to tifffile
+            # Fall back to tifffile for files TiffSlide cannot open
             with tifffile.TiffFile(filepath) as tif:
                 if series_index < 0 or series_index >= len(tif.series):
                     raise ValueError(
@@ -640,35 +1219,52 @@ class TIFFSlideLoader(FormatLoader):
 
                 return tif.series[series_index].asarray()
 
+        if series_index < 0 or series_index >= level_count:
+            raise ValueError(f"Series index {series_index} out of range")
+
+        # Return a lazy zarr view over the pyramid level instead of
+        # materializing the (potentially 50k x 50k) region through
+        # PIL; consumers read only the tiles they actually slice. Not
+        # wrapped in the fallback above: a failure here (e.g. a
+        # tifffile/zarr version mismatch) must surface rather than
+        # silently materialize the whole level
+        store = tifffile.imread(filepath, aszarr=True, level=series_index)
+        return zarr.open(store, mode="r")
+
+    @staticmethod
+    def _tifffile_metadata(filepath: str, series_index: int) -> Dict:
+        with tifffile.TiffFile(filepath) as tif:
+            if series_index < 0 or series_index >= len(tif.series):
+                return {}
+
+            series = tif.series[series_index]
+            return {
+                "shape": series.shape,
+                "dtype": str(series.dtype),
+                "axes": series.axes,
+            }
+
     @staticmethod
     def get_metadata(filepath: str, series_index: int) -> Dict:
-        try:
-            with TiffSlide(filepath) as slide:
-                if series_index < 0 or series_index >= len(
-                    slide.level_dimensions
-                ):
-                    return {}
+        if TIFFSlideLoader._is_plain_tiff(filepath):
+            return TIFFSlideLoader._tifffile_metadata(filepath, series_index)
 
-                return {
-                    "axes": slide.properties["tiffslide.series-axes"],
-                    "resolution": (
-                        slide.properties["tiffslide.mpp-x"],
-                        slide.properties["tiffslide.mpp-y"],
-                    ),
-                    "unit": "um",
-                }
+        try:
+            slide = _open_tiffslide(filepath)
+            if series_index < 0 or series_index >= len(slide.level_dimensions):
+                return {}
+
+            return {
+                "axes": slide.properties["tiffslide.series-axes"],
+                "resolution": (
+                    slide.properties["tiffslide.mpp-x"],
+                    slide.properties["tiffslide.mpp-y"],
+                ),
+                "unit": "um",
+            }
         except (ValueError, FileNotFoundError):
             # Fall back to tifffile
-            with tifffile.TiffFile(filepath) as tif:
-                if series_index < 0 or series_index >= len(tif.series):
-                    return {}
-
-                series = tif.series[series_index]
-                return {
-                    "shape": series.shape,
-                    "dtype": str(series.dtype),
-                    "axes": series.axes,
-                }
+            return TIFFSlideLoader._tifffile_metadata(filepath, series_index)
 
 
 class CZILoader(FormatLoader):
@@ -683,26 +1279,22 @@ class CZILoader(FormatLoader):
     @staticmethod
     def get_series_count(filepath: str) -> int:
         try:
-            with czi.open_czi(filepath) as czi_file:
-                scenes = czi_file.scenes_bounding_rectangle
-                return len(scenes)
+            return len(_read_czi_info(filepath)["scenes"])
         except (ValueError, FileNotFoundError):
             return 0
 
     @staticmethod
     def load_series(filepath: str, series_index: int) -> np.ndarray:
         try:
-            with czi.open_czi(filepath) as czi_file:
-                scenes = czi_file.scenes_bounding_rectangle
+            scenes = _read_czi_info(filepath)["scenes"]
 
-                if series_index < 0 or series_index >= len(scenes):
-                    raise ValueError(
-                        f"Scene index {series_index} out of range"
-                    )
+            if series_index < 0 or series_index >= len(scenes):
+                raise ValueError(f"Scene index {series_index} out of range")
 
-                scene_keys = list(scenes.keys())
-                scene_index = scene_keys[series_index]
+            scene_keys = list(scenes.keys())
+            scene_index = scene_keys[series_index]
 
+            with czi.open_czi(filepath) as czi_file:
                 # You might need to specify pixel_type if automatic detection fails
                 image = czi_file.read(scene=scene_index)
                 return image
@@ -731,44 +1323,37 @@ class CZILoader(FormatLoader):
     @staticmethod
     def get_metadata(filepath: str, series_index: int) -> Dict:
         try:
-            with czi.open_czi(filepath) as czi_file:
-                scenes = czi_file.scenes_bounding_rectangle
-
-                if series_index < 0 or series_index >= len(scenes):
-                    return {}
+            info = _read_czi_info(filepath)
 
-                # scene_keys = list(scenes.keys())
-                # scene_index = scene_keys[series_index]
-                # scene = scenes[scene_index]
+            if series_index < 0 or series_index >= len(info["scenes"]):
+                return {}
 
-                dims = czi_file.total_bounding_box
+            dims = info["total_bounding_box"]
 
-                # Extract the raw metadata as an XML string
-                metadata_xml = czi_file.raw_metadata
-
-                # Initialize metadata with default values
-                try:
-                    # scales are in meters, convert to microns
-                    scale_x = CZILoader.get_scales(metadata_xml, "X") * 1e6
-                    scale_y = CZILoader.get_scales(metadata_xml, "Y") * 1e6
+            # The raw metadata as an XML string
+            metadata_xml = info["raw_metadata"]
 
-                    filtered_dims = {
-                        k: v for k, v in dims.items() if v != (0, 1)
-                    }
-                    axes = "".join(filtered_dims.keys())
-                    metadata = {
-                        "axes": axes,
-                        "resolution": (scale_x, scale_y),
-                        "unit": "um",
-                    }
+            # Initialize metadata with default values
+            try:
+                # scales are in meters, convert to microns
+                scale_x = CZILoader.get_scales(metadata_xml, "X") * 1e6
+                scale_y = CZILoader.get_scales(metadata_xml, "Y") * 1e6
+
+                filtered_dims = {k: v for k, v in dims.items() if v != (0, 1)}
+                axes = "".join(filtered_dims.keys())
+                metadata = {
+                    "axes": axes,
+                    "resolution": (scale_x, scale_y),
+                    "unit": "um",
+                }
 
-                    if dims["Z"] != (0, 1):
-                        scale_z = CZILoader.get_scales(metadata_xml, "Z")
-                        metadata["spacing"] = scale_z
-                except ValueError as e:
-                    print(f"Error getting scale metadata: {e}")
+                if dims["Z"] != (0, 1):
+                    scale_z = CZILoader.get_scales(metadata_xml, "Z")
+                    metadata["spacing"] = scale_z
+            except ValueError as e:
+                print(f"Error getting scale metadata: {e}")
 
-                return metadata
+            return metadata
 
         except (ValueError, FileNotFoundError, RuntimeError) as e:
             print(f"Error getting metadata: {e}")
@@ -779,23 +1364,16 @@ class CZILoader(FormatLoader):
         filepath: str, series_index: int
     ) -> Dict[str, float]:
         try:
-            with czi.open_czi(filepath) as czi_file:
-                scenes = czi_file.scenes_bounding_rectangle
-
-                if series_index < 0 or series_index >= len(scenes):
-                    raise ValueError(
-                        f"Scene index {series_index} out of range"
-                    )
-
-                # scene_keys = list(scenes.keys())
-                # scene_index = scene_keys[series_index]
+            info = _read_czi_info(filepath)
 
-                # Get scale information
-                scale_x = czi_file.scale_x
-                scale_y = czi_file.scale_y
-                scale_z = czi_file.scale_z
+            if series_index < 0 or series_index >= len(info["scenes"]):
+                raise ValueError(f"Scene index {series_index} out of range")
 
-                return {"X": scale_x, "Y": scale_y, "Z": scale_z}
+            return {
+                "X": info["scale_x"],
+                "Y": info["scale_y"],
+                "Z": info["scale_z"],
+            }
         except (ValueError, FileNotFoundError) as e:
             print(f"Error getting pixel size: {str(e)}")
             return {}
@@ -807,6 +1385,10 @@ class AcquiferLoader(FormatLoader):
     # Cache for loaded datasets to avoid reloading the same directory multiple times
     _dataset_cache = {}  # {directory_path: xarray_dataset}
 
+    # Image suffixes accepted inside a dataset directory; built once so
+    # the directory walks below do a single C-level endswith per file
+    _IMAGE_EXTENSIONS = (".tif", ".tiff", ".png", ".jpg", ".jpeg")
+
     @staticmethod
     def can_load(filepath: str) -> bool:
         """
@@ -816,17 +1398,13 @@ class AcquiferLoader(FormatLoader):
             return False
 
         try:
-
-            # Check if directory contains files
-            image_files = []
-            for root, _, files in os.walk(filepath):
+            # One image file anywhere in the tree is enough; stop the
+            # walk at the first hit instead of collecting them all
+            for _root, _, files in os.walk(filepath):
                 for file in files:
-                    if file.lower().endswith(
-                        (".tif", ".tiff", ".png", ".jpg", ".jpeg")
-                    ):
-                        image_files.append(os.path.join(root, file))
-
-            return bool(image_files)
+                    if file.lower().endswith(AcquiferLoader._IMAGE_EXTENSIONS):
+                        return True
+            return False
         except (ValueError, FileNotFoundError) as e:
             print(f"Error checking Acquifer dataset: {e}")
             return False
@@ -844,9 +1422,7 @@ class AcquiferLoader(FormatLoader):
             image_files = []
             for root, _, files in os.walk(directory):
                 for file in files:
-                    if file.lower().endswith(
-                        (".tif", ".tiff", ".png", ".jpg", ".jpeg")
-                    ):
+                    if file.lower().endswith(AcquiferLoader._IMAGE_EXTENSIONS):
                         image_files.append(os.path.join(root, file))
 
             if not image_files:
@@ -983,11 +1559,369 @@ class AcquiferLoader(FormatLoader):
             return {}
 
 
+# Registered format loaders, in matching order
+FORMAT_LOADERS = [
+    LIFLoader,
+    ND2Loader,
+    TIFFSlideLoader,
+    CZILoader,
+    AcquiferLoader,
+]
+
+# Extension dispatch tables for the scan loop: one dict lookup per file
+# instead of a chain of endswith calls or a linear can_load probe.
+# Acquifer datasets are directories and are handled separately.
+_EXT_TO_TYPE = {
+    ".lif": "LIF",
+    ".nd2": "ND2",
+    ".ndpi": "Slide",
+    ".svs": "Slide",
+    ".scn": "Slide",
+    ".mrxs": "Slide",
+    ".czi": "CZI",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+}
+
+_EXT_TO_LOADER = {
+    ".lif": LIFLoader,
+    ".nd2": ND2Loader,
+    ".ndpi": TIFFSlideLoader,
+    ".svs": TIFFSlideLoader,
+    ".scn": TIFFSlideLoader,
+    ".mrxs": TIFFSlideLoader,
+    ".tif": TIFFSlideLoader,
+    ".tiff": TIFFSlideLoader,
+    ".czi": CZILoader,
+}
+
+
+def _get_loader_for_path(filepath: str) -> Optional[FormatLoader]:
+    """Resolve the loader for a file path (picklable, usable in workers)"""
+    for loader in FORMAT_LOADERS:
+        if loader.can_load(filepath):
+            return loader
+    return None
+
+
+class _SeriesCountCache:
+    """Persistent series-count cache keyed on (path, mtime_ns, size).
+
+    A file's series count is a pure function of its bytes, so unchanged
+    files can skip the header parse entirely on rescans. Stored as a
+    small sqlite database (WAL mode) under ~/.cache/napari-tmidas.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        if cache_path is None:
+            cache_dir = os.path.join(
+                os.path.expanduser("~"), ".cache", "napari-tmidas"
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            cache_path = os.path.join(cache_dir, "series_counts.sqlite")
+
+        self._conn = sqlite3.connect(cache_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS series_counts ("
+            "path TEXT PRIMARY KEY, "
+            "mtime_ns INTEGER, "
+            "size INTEGER, "
+            "series_count INTEGER)"
+        )
+        self._conn.commit()
+
+    def get(self, path: str, mtime_ns: int, size: int) -> Optional[int]:
+        """Return the cached count, or None on miss or stale entry"""
+        row = self._conn.execute(
+            "SELECT series_count FROM series_counts "
+            "WHERE path = ? AND mtime_ns = ? AND size = ?",
+            (path, mtime_ns, size),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, mtime_ns: int, size: int, series_count: int):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO series_counts VALUES (?, ?, ?, ?)",
+            (path, mtime_ns, size, series_count),
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+def _probe_series(filepath: str) -> Tuple[str, int]:
+    """Probe a file's series count (top-level so it is picklable).
+
+    Header parsing in the format readers is CPU-bound and does not
+    release the GIL, so probing runs in worker processes; the loader is
+    re-resolved from the path inside the worker.
+    """
+    loader = _get_loader_for_path(filepath)
+    if loader is None:
+        return filepath, -1
+    return filepath, loader.get_series_count(filepath)
+
+
+def _iter_planes_pipelined(filepath: str, series_index: int):
+    """Yield LIF planes decoded by a background producer thread.
+
+    A bounded two-plane queue lets decoding run ahead of the consumer,
+    so LIF decompression overlaps with the compression and disk writes
+    happening downstream while never holding more than a couple of
+    planes in memory.
+    """
+    plane_queue: queue.Queue = queue.Queue(maxsize=2)
+    errors = []
+
+    def _decode():
+        try:
+            for item in LIFLoader.iter_planes(filepath, series_index):
+                plane_queue.put(item)
+        except (ValueError, OSError) as e:
+            errors.append(e)
+        finally:
+            plane_queue.put(None)
+
+    producer = threading.Thread(target=_decode, daemon=True)
+    producer.start()
+
+    while True:
+        item = plane_queue.get()
+        if item is None:
+            break
+        yield item
+
+    producer.join()
+    if errors:
+        raise errors[0]
+
+
+def _stream_lif_to_zarr(
+    filepath: str, series_index: int, output_path: str
+) -> bool:
+    """Stream a LIF series plane by plane into an OME-Zarr store.
+
+    Avoids materializing the full series in RAM: each decoded plane is
+    written directly into its chunk of the store. The layout mirrors
+    _save_zarr — a group with a single-scale dataset "0" in tczyx order
+    plus multiscales metadata — so streamed and in-memory conversions
+    produce interchangeable stores.
+    """
+    t_size, z_size, c_size, y_size, x_size = LIFLoader.get_series_shape(
+        filepath, series_index
+    )
+
+    # Handle overwriting by deleting the directory if it exists
+    if os.path.exists(output_path):
+        print(f"Deleting existing Zarr directory: {output_path}")
+        shutil.rmtree(output_path)
+
+    if HAS_LIBURING:
+        store = IoUringDirectoryStore(output_path)
+    else:
+        store = parse_url(output_path, mode="w").store
+
+    # Let Blosc compress each chunk with its internal thread pool
+    numcodecs.blosc.use_threads = True
+
+    root = zarr.group(store=store)
+    zarr_array = root.create_dataset(
+        "0",
+        shape=(t_size, c_size, z_size, y_size, x_size),
+        chunks=(1, 1, 1, y_size, x_size),
+        dtype=np.uint16,
+        compressor=_ZARR_COMPRESSOR,
+    )
+
+    # Blosc compression of each chunk overlaps with decoding of the
+    # next plane on the producer thread
+    for (t, z, c), plane in _iter_planes_pipelined(filepath, series_index):
+        zarr_array[t, c, z] = plane
+
+    # Make sure all batched chunk writes have hit the disk
+    if hasattr(store, "flush"):
+        store.flush()
+
+    root.attrs["multiscales"] = [
+        {
+            "version": "0.4",
+            "datasets": [{"path": "0"}],
+            "axes": [
+                {
+                    "name": ax,
+                    "type": (
+                        "space"
+                        if ax in "xyz"
+                        else "time" if ax == "t" else "channel"
+                    ),
+                }
+                for ax in "tczyx"
+            ],
+        }
+    ]
+
+    return True
+
+
+def _stream_lif_to_tif(
+    filepath: str, series_index: int, output_path: str
+) -> bool:
+    """Stream a LIF series plane by plane into a TIFF file.
+
+    The full (T, Z, C, Y, X) series is declared up front and fed from
+    the plane iterator, so the output is a single hyperstack with axes
+    metadata — identical in structure to the non-streamed save path —
+    while only one decoded plane is in memory at a time.
+    """
+    shape = LIFLoader.get_series_shape(filepath, series_index)
+    total_planes = shape[0] * shape[1] * shape[2]
+
+    estimated_size_bytes = prod(shape) * np.dtype(np.uint16).itemsize
+    use_bigtiff = estimated_size_bytes / (1024**3) > 4
+
+    metadata = LIFLoader.get_metadata(filepath, series_index)
+    tif_metadata = {"axes": "TZCYX"}
+    if "unit" in metadata:
+        tif_metadata["unit"] = metadata["unit"]
+    if "spacing" in metadata:
+        tif_metadata["spacing"] = float(metadata["spacing"])
+
+    resolution = None
+    if "resolution" in metadata:
+        try:
+            res_x, res_y = metadata["resolution"]
+            resolution = (float(res_x), float(res_y))
+        except (ValueError, TypeError) as e:
+            print(f"Error processing resolution: {e}")
+
+    def _planes():
+        # Planes arrive in TZC order (C fastest), matching the ImageJ
+        # hyperstack plane layout; the declared shape is completed with
+        # zero planes if the reader skipped missing frames
+        written = 0
+        for _index, plane in _iter_planes_pipelined(filepath, series_index):
+            written += 1
+            yield plane
+        if written < total_planes:
+            print(
+                f"Warning: {total_planes - written} frames were missing "
+                "and filled with zeros."
+            )
+            fill = np.zeros(shape[-2:], dtype=np.uint16)
+            for _ in range(total_planes - written):
+                yield fill
+
+    with tifffile.TiffWriter(
+        output_path, bigtiff=use_bigtiff, imagej=not use_bigtiff
+    ) as writer:
+        writer.write(
+            _planes(),
+            shape=shape,
+            dtype=np.uint16,
+            metadata=tif_metadata,
+            resolution=resolution,
+            compression="zlib",
+            compressionargs={"level": 6},
+            maxworkers=os.cpu_count(),
+        )
+
+    return os.path.exists(output_path)
+
+
+def _convert_one(
+    filepath: str, series_index: int, output_folder: str, use_zarr: bool
+) -> Tuple[bool, str]:
+    """Convert a single series of a single file.
+
+    Top-level function so it can be dispatched to a process pool.
+    Returns (success, message).
+    """
+    loader = _get_loader_for_path(filepath)
+    if not loader:
+        return False, "Unsupported file format"
+
+    # LIF series can be streamed plane by plane straight into the output
+    # store, keeping only one decoded plane in memory at a time
+    if loader is LIFLoader:
+        base_name = Path(filepath).stem
+        extension = "zarr" if use_zarr else "tif"
+        output_path = os.path.join(
+            output_folder, f"{base_name}_series{series_index}.{extension}"
+        )
+        try:
+            if use_zarr:
+                save_success = _stream_lif_to_zarr(
+                    filepath, series_index, output_path
+                )
+            else:
+                save_success = _stream_lif_to_tif(
+                    filepath, series_index, output_path
+                )
+            if save_success:
+                return True, f"Saved to {output_path}"
+            return False, "Failed to save file - unknown error"
+        except (ValueError, FileNotFoundError) as e:
+            return False, f"Failed to save file: {str(e)}"
+
+    # Load series - this is the critical part that must succeed
+    try:
+        image_data = loader.load_series(filepath, series_index)
+    except (ValueError, FileNotFoundError) as e:
+        return False, f"Failed to load image: {str(e)}"
+
+    # Try to extract metadata - but don't fail if this doesn't work
+    try:
+        metadata = loader.get_metadata(filepath, series_index) or {}
+        print(f"Extracted metadata keys: {list(metadata.keys())}")
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Warning: Failed to extract metadata: {str(e)}")
+        metadata = {}
+
+    # Generate output filename
+    base_name = Path(filepath).stem
+
+    # Determine format based on size and settings
+    estimated_size_bytes = prod(image_data.shape) * image_data.itemsize
+    file_size_GB = estimated_size_bytes / (1024**3)
+
+    # If file is very large (>4GB) and user didn't explicitly choose TIF,
+    # ZARR format is recommended but respect user's choice
+    if file_size_GB > 4 and not use_zarr:
+        print(
+            f"File size ({file_size_GB:.2f}GB) exceeds 4GB, ZARR format is recommended but using TIF with BigTIFF format"
+        )
+
+    # Set up the output path
+    extension = "zarr" if use_zarr else "tif"
+    output_path = os.path.join(
+        output_folder,
+        f"{base_name}_series{series_index}.{extension}",
+    )
+
+    # The crucial part - save the file
+    try:
+        if use_zarr:
+            save_success = _save_zarr(image_data, output_path, metadata)
+        else:
+            _save_tif(image_data, output_path, metadata)
+            save_success = os.path.exists(output_path)
+
+        if save_success:
+            return True, f"Saved to {output_path}"
+        return False, "Failed to save file - unknown error"
+    except (ValueError, FileNotFoundError) as e:
+        error_message = f"Failed to save file: {str(e)}"
+        print(f"Error in save operation: {error_message}")
+        return False, error_message
+
+
 class ScanFolderWorker(QThread):
     """Worker thread for scanning folders"""
 
-    progress = Signal(int, int)  # current, total
-    finished = Signal(list)  # list of found files
+    progress = Signal(int)  # number of files found so far
+    finished = Signal(list)  # list of (path, mtime_ns, size)
     error = Signal(str)  # error message
 
     def __init__(self, folder: str, filters: List[str]):
@@ -995,45 +1929,239 @@ class ScanFolderWorker(QThread):
         self.folder = folder
         self.filters = filters
 
+        # Directories may be Acquifer datasets
+        self._include_directories = "acquifer" in [f.lower() for f in filters]
+
+        # str.endswith accepts a tuple of suffixes, one C call per name;
+        # built once here instead of per scan
+        self._suffixes = tuple(
+            f.lower() for f in filters if f.lower() != "acquifer"
+        )
+
+        self._stop = False
+
+    def stop(self):
+        """Request a graceful stop of the scan"""
+        self._stop = True
+
+    def _scan_one(self, directory: str) -> Tuple[List[tuple], List[str]]:
+        """Scan a single directory, returning (matches, subdirectories).
+
+        DirEntry.is_file/is_dir use the d_type cached from the directory
+        read, so matching does not cost an extra stat per entry. FIFOs,
+        sockets and broken symlinks are skipped: handing one to a format
+        reader later can hang indefinitely. Matches carry
+        (path, mtime_ns, size) from the DirEntry's cached stat so the
+        series-count cache never has to stat the file again (None/None
+        for Acquifer directories, whose mtime is not a content key).
+        """
+        matches = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (
+                            self._include_directories
+                            and AcquiferLoader.can_load(entry.path)
+                        ):
+                            matches.append((entry.path, None, None))
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(self._suffixes):
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        matches.append(
+                            (
+                                entry.path,
+                                entry_stat.st_mtime_ns,
+                                entry_stat.st_size,
+                            )
+                        )
+        except OSError as e:
+            # Skip unreadable directories (permissions, vanished paths)
+            # and keep scanning the rest, like os.walk did
+            print(f"Skipping {directory}: {e}")
+        return matches, subdirs
+
     def run(self):
         try:
             found_files = []
-            all_items = []
 
-            # Get both files and potential Acquifer directories
-            include_directories = "acquifer" in [
-                f.lower() for f in self.filters
-            ]
+            # Fan the traversal out over a thread pool, one task per
+            # directory: the kernel services concurrent directory reads
+            # nearly linearly on SSDs. Each task returns its own lists
+            # which are merged here, so no locking is needed.
+            last_emit = time.monotonic()
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                pending = {executor.submit(self._scan_one, self.folder)}
+                while pending:
+                    done, pending = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    if self._stop:
+                        for future in pending:
+                            future.cancel()
+                        return
+
+                    for future in done:
+                        matches, subdirs = future.result()
+                        found_files.extend(matches)
+                        for subdir in subdirs:
+                            pending.add(
+                                executor.submit(self._scan_one, subdir)
+                            )
 
-            # Count items to scan
-            for root, dirs, files in os.walk(self.folder):
-                for file in files:
-                    if any(
-                        file.lower().endswith(f)
-                        for f in self.filters
-                        if f.lower() != "acquifer"
-                    ):
-                        all_items.append(os.path.join(root, file))
+                    # Total is unknown during traversal; report the
+                    # running count so the GUI can show scan activity,
+                    # throttled so signal delivery does not dominate
+                    now = time.monotonic()
+                    if now - last_emit > _PROGRESS_INTERVAL:
+                        last_emit = now
+                        self.progress.emit(len(found_files))
+
+            self.progress.emit(len(found_files))
+            self.finished.emit(found_files)
+        except (ValueError, FileNotFoundError, OSError) as e:
+            self.error.emit(str(e))
 
-                # Add potential Acquifer directories
-                if include_directories:
-                    for dir_name in dirs:
-                        dir_path = os.path.join(root, dir_name)
-                        if AcquiferLoader.can_load(dir_path):
-                            all_items.append(dir_path)
 
-            # Scan all items
-            total_items = len(all_items)
-            for i, item_path in enumerate(all_items):
-                if i % 10 == 0:
-                    self.progress.emit(i, total_items)
+class ProbeWorker(QThread):
+    """Worker thread that probes series counts for scanned files.
 
-                found_files.append(item_path)
+    Header parsing runs in a process pool (it is CPU-bound and holds the
+    GIL); this thread drains the pool and hands results to the GUI
+    thread via queued signals, so the event loop repaints naturally
+    between updates instead of being pumped manually.
+    """
 
-            self.finished.emit(found_files)
-        except (ValueError, FileNotFoundError) as e:
+    file_probed = Signal(str, str, int)  # filepath, file_type, count
+    status = Signal(str)
+    finished = Signal(int)  # number of files probed
+    error = Signal(str)
+
+    def __init__(self, files_and_types: List[tuple]):
+        super().__init__()
+        # Entries are (filepath, file_type, mtime_ns, size); the stat
+        # fields come from the scan's DirEntry cache (None for Acquifer
+        # directories)
+        self.files_and_types = files_and_types
+
+    def run(self):
+        try:
+            self._probe_all()
+        except (ValueError, OSError) as e:
             self.error.emit(str(e))
 
+    def _probe_all(self):
+        # sqlite connections are thread-affine, so the cache is opened
+        # on this thread rather than in the widget.
+        # Series counts only change when the file does: entries are
+        # keyed by (path, mtime, size) and only misses are probed.
+        # Acquifer datasets are directories whose mtime does not track
+        # content changes, so those are always re-probed.
+        try:
+            cache = _SeriesCountCache()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Series count cache unavailable: {str(e)}")
+            cache = None
+
+        file_count = len(self.files_and_types)
+        processed = 0
+        last_emit = 0.0
+
+        # Probe series counts in worker processes: the format readers'
+        # header parsing is CPU-bound and holds the GIL, so threads
+        # would serialize on it
+        max_workers = os.cpu_count() or 1
+        in_flight_cap = max_workers * 2
+
+        entries = iter(self.files_and_types)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {}
+
+            def _submit_next() -> bool:
+                nonlocal processed
+                for filepath, file_type, mtime_ns, size in entries:
+                    cache_key = None
+                    if (
+                        cache is not None
+                        and file_type != "Acquifer"
+                        and mtime_ns is not None
+                    ):
+                        cache_key = (
+                            os.path.abspath(filepath),
+                            mtime_ns,
+                            size,
+                        )
+                        cached_count = cache.get(*cache_key)
+                        if cached_count is not None:
+                            processed += 1
+                            self.file_probed.emit(
+                                filepath, file_type, cached_count
+                            )
+                            continue
+
+                    future = executor.submit(_probe_series, filepath)
+                    futures[future] = (filepath, file_type, cache_key)
+                    return True
+                return False
+
+            # Submission is streamed with a small in-flight window
+            # rather than queueing every file up front: peak memory for
+            # futures and argument tuples stays O(workers) instead of
+            # O(files), which matters for 100k-file scans
+            while len(futures) < in_flight_cap and _submit_next():
+                pass
+
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    filepath, file_type, cache_key = futures.pop(future)
+                    processed += 1
+
+                    try:
+                        _probed_path, series_count = future.result()
+                        self.file_probed.emit(
+                            filepath, file_type, series_count
+                        )
+                        if cache_key is not None and series_count >= 0:
+                            cache.put(*cache_key, series_count)
+                    except (ValueError, FileNotFoundError) as e:
+                        print(f"Error processing {filepath}: {str(e)}")
+                        # Report file with error indication
+                        self.file_probed.emit(filepath, file_type, -1)
+
+                    # Throttled status update; the GUI thread repaints
+                    # between queued signals on its own
+                    now = time.monotonic()
+                    if (
+                        now - last_emit >= _PROGRESS_INTERVAL
+                        or processed == file_count
+                    ):
+                        last_emit = now
+                        self.status.emit(
+                            f"Processed {processed}/{file_count} files..."
+                        )
+
+                # Refill the window with the next files to probe
+                while len(futures) < in_flight_cap and _submit_next():
+                    pass
+
+        if cache is not None:
+            cache.close()
+
+        self.finished.emit(file_count)
+
 
 class ConversionWorker(QThread):
     """Worker thread for file conversion"""
@@ -1044,12 +2172,14 @@ class ConversionWorker(QThread):
 
     def __init__(
         self,
-        files_to_convert: List[Tuple[str, int]],
+        files_to_convert,
         output_folder: str,
         use_zarr: bool,
         file_loader_func,
     ):
         super().__init__()
+        # Either a {filepath: series_index} mapping or an iterable of
+        # (filepath, series_index) pairs
         self.files_to_convert = files_to_convert
         self.output_folder = output_folder
         self.use_zarr = use_zarr
@@ -1058,391 +2188,461 @@ class ConversionWorker(QThread):
 
     def run(self):
         success_count = 0
-        for i, (filepath, series_index) in enumerate(self.files_to_convert):
-            if not self.running:
-                break
-
-            # Update progress
-            self.progress.emit(
-                i + 1, len(self.files_to_convert), Path(filepath).name
-            )
+        total = len(self.files_to_convert)
 
-            try:
-                # Get loader
-                loader = self.get_file_loader(filepath)
-                if not loader:
-                    self.file_done.emit(
-                        filepath, False, "Unsupported file format"
-                    )
-                    continue
-
-                # Load series - this is the critical part that must succeed
-                try:
-                    image_data = loader.load_series(filepath, series_index)
-                except (ValueError, FileNotFoundError) as e:
-                    self.file_done.emit(
-                        filepath, False, f"Failed to load image: {str(e)}"
-                    )
-                    continue
+        # Convert independent files in parallel: compression is CPU-heavy
+        # and embarrassingly parallel across files. Half the cores are
+        # used so the compression threads and disk I/O inside each
+        # worker still have headroom
+        max_workers = max(1, (os.cpu_count() or 1) // 2)
+        in_flight_cap = max_workers * 2
 
-                # Try to extract metadata - but don't fail if this doesn't work
-                metadata = None
-                try:
-                    metadata = (
-                        loader.get_metadata(filepath, series_index) or {}
-                    )
-                    print(f"Extracted metadata keys: {list(metadata.keys())}")
-                except (ValueError, FileNotFoundError) as e:
-                    print(f"Warning: Failed to extract metadata: {str(e)}")
-                    metadata = {}
+        if hasattr(self.files_to_convert, "items"):
+            pending = iter(self.files_to_convert.items())
+        else:
+            pending = iter(self.files_to_convert)
+        done_count = 0
+        last_emit = 0.0
 
-                # Generate output filename
-                base_name = Path(filepath).stem
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {}
 
-                # Determine format based on size and settings
-                estimated_size_bytes = (
-                    np.prod(image_data.shape) * image_data.itemsize
-                )
-                file_size_GB = estimated_size_bytes / (1024**3)
-
-                # Determine format
-                use_zarr = self.use_zarr
-                # If file is very large (>4GB) and user didn't explicitly choose TIF,
-                # auto-switch to ZARR format
-                if file_size_GB > 4 and not self.use_zarr:
-                    # Recommend ZARR format but respect user's choice by still allowing TIF
-                    print(
-                        f"File size ({file_size_GB:.2f}GB) exceeds 4GB, ZARR format is recommended but using TIF with BigTIFF format"
-                    )
-                    self.file_done.emit(
+            def _submit_next() -> bool:
+                for filepath, series_index in pending:
+                    future = executor.submit(
+                        _convert_one,
                         filepath,
-                        True,
-                        f"File size ({file_size_GB:.2f}GB) exceeds 4GB, using TIF with BigTIFF format",
-                    )
-
-                # Set up the output path
-                if use_zarr:
-                    output_path = os.path.join(
+                        series_index,
                         self.output_folder,
-                        f"{base_name}_series{series_index}.zarr",
+                        self.use_zarr,
                     )
-                else:
-                    output_path = os.path.join(
-                        self.output_folder,
-                        f"{base_name}_series{series_index}.tif",
-                    )
-
-                # The crucial part - save the file with separate try/except for each save method
-                save_success = False
-                error_message = ""
+                    futures[future] = filepath
+                    return True
+                return False
 
-                try:
-                    if use_zarr:
-                        save_success = self._save_zarr(
-                            image_data, output_path, metadata
+            # Decoded series can be gigabytes each, so keep only a
+            # couple of conversions per worker in flight at a time
+            while len(futures) < in_flight_cap and _submit_next():
+                pass
+
+            while futures:
+                if not self.running:
+                    # Drop conversions that have not started yet;
+                    # running ones finish on the way out
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    futures,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    filepath = futures.pop(future)
+
+                    done_count += 1
+                    # Throttled like the scan progress; the final file
+                    # always reports so the bar reaches 100%
+                    now = time.monotonic()
+                    if (
+                        done_count == total
+                        or now - last_emit > _PROGRESS_INTERVAL
+                    ):
+                        last_emit = now
+                        self.progress.emit(
+                            done_count, total, Path(filepath).name
                         )
-                    else:
-                        self._save_tif(image_data, output_path, metadata)
-                        save_success = os.path.exists(output_path)
 
-                    if save_success:
-                        success_count += 1
+                    try:
+                        success, message = future.result()
+                    except (ValueError, FileNotFoundError) as e:
+                        print(f"Unexpected error during conversion: {str(e)}")
                         self.file_done.emit(
-                            filepath, True, f"Saved to {output_path}"
+                            filepath, False, f"Unexpected error: {str(e)}"
                         )
-                    else:
-                        error_message = "Failed to save file - unknown error"
-                        self.file_done.emit(filepath, False, error_message)
+                        continue
 
-                except (ValueError, FileNotFoundError) as e:
-                    error_message = f"Failed to save file: {str(e)}"
-                    print(f"Error in save operation: {error_message}")
-                    self.file_done.emit(filepath, False, error_message)
-
-            except (ValueError, FileNotFoundError) as e:
-                print(f"Unexpected error during conversion: {str(e)}")
-                self.file_done.emit(
-                    filepath, False, f"Unexpected error: {str(e)}"
-                )
+                    if success:
+                        success_count += 1
+                    self.file_done.emit(filepath, success, message)
+
+                # Refill the window with the next queued conversions
+                while len(futures) < in_flight_cap and _submit_next():
+                    pass
 
         self.finished.emit(success_count)
 
     def stop(self):
         self.running = False
 
-    def _save_tif(
-        self, image_data: np.ndarray, output_path: str, metadata: dict = None
-    ):
-        """Enhanced TIF saving with proper dimension handling and BigTIFF support"""
-        import tifffile
 
-        print(f"Saving TIF file: {output_path}")
-        print(f"Image data shape: {image_data.shape}")
+def _write_tif_planes(
+    image_data, output_path: str, resolution=None, compression="zlib"
+):
+    """Stream an array to BigTIFF one 2-D plane at a time.
 
-        # Check if this is a large file that needs BigTIFF
-        estimated_size_bytes = np.prod(image_data.shape) * image_data.itemsize
-        file_size_GB = estimated_size_bytes / (1024**3)
-        use_bigtiff = file_size_GB > 4
+    Avoids holding the full array plus its compressed output in RAM at
+    once: only one plane and its compressed bytes are in flight at any
+    time. Works for numpy and lazily-evaluated (dask/zarr) arrays alike.
+    The N-D shape is declared once and fed from a plane iterator so the
+    output is a single series, not one series per plane.
+    """
+    planes = image_data.reshape(-1, *image_data.shape[-2:])
+
+    def _iter_planes():
+        for plane in planes:
+            yield np.asarray(plane)
+
+    with tifffile.TiffWriter(output_path, bigtiff=True) as writer:
+        writer.write(
+            _iter_planes(),
+            shape=tuple(image_data.shape),
+            dtype=image_data.dtype,
+            resolution=resolution,
+            compression=compression,
+            compressionargs={"level": 6},
+            maxworkers=os.cpu_count(),
+        )
 
-        if use_bigtiff:
-            print(
-                f"File size ({file_size_GB:.2f}GB) exceeds 4GB, using BigTIFF format"
-            )
 
-        if metadata:
-            print(f"Metadata keys: {list(metadata.keys())}")
-            if "axes" in metadata:
-                print(f"Original axes: {metadata['axes']}")
+def _save_tif(image_data: np.ndarray, output_path: str, metadata: dict = None):
+    """Enhanced TIF saving with proper dimension handling and BigTIFF support"""
+    import tifffile
 
-        # Handle Dask arrays
-        if hasattr(image_data, "compute"):
-            print("Computing Dask array before saving")
-            # For large arrays, compute block by block
-            try:
-                # Convert to numpy array in memory
-                image_data = image_data.compute()
-            except (MemoryError, ValueError) as e:
-                print(f"Error computing dask array: {e}")
-                # Alternative: write block by block
-                # This would require custom implementation
-                raise
-
-        # Basic save if no metadata
-        if metadata is None:
-            print("No metadata provided, using basic save")
-            tifffile.imwrite(
-                output_path,
-                image_data,
-                compression="zlib",
-                bigtiff=use_bigtiff,
-            )
-            return
+    print(f"Saving TIF file: {output_path}")
+    print(f"Image data shape: {image_data.shape}")
 
-        # Get image dimensions and axis order
-        ndim = len(image_data.shape)
-        axes = metadata.get("axes", "")
+    # Check if this is a large file that needs BigTIFF
+    estimated_size_bytes = prod(image_data.shape) * image_data.itemsize
+    file_size_GB = estimated_size_bytes / (1024**3)
+    use_bigtiff = file_size_GB > 4
 
-        print(f"Number of dimensions: {ndim}")
-        if axes:
-            print(f"Axes from metadata: {axes}")
+    if use_bigtiff:
+        print(
+            f"File size ({file_size_GB:.2f}GB) exceeds 4GB, using BigTIFF format"
+        )
 
-        # Handle ImageJ compatibility for dimensions
-        if ndim > 2:
-            # Get target order for ImageJ
-            imagej_order = "TZCYX"
+    if metadata:
+        print(f"Metadata keys: {list(metadata.keys())}")
+        if "axes" in metadata:
+            print(f"Original axes: {metadata['axes']}")
 
-            # If axes information is incomplete, try to infer from shape
-            if len(axes) != ndim:
-                print(
-                    f"Warning: Axes length ({len(axes)}) doesn't match dimensions ({ndim})"
-                )
-                # For your specific case with shape (45, 101, 4, 1024, 1024)
-                # Infer TZCYX if shape matches
-                if (
-                    ndim == 5
-                    and image_data.shape[2] <= 10
-                    and image_data.shape[3] > 100
-                    and image_data.shape[4] > 100
-                ):
-                    print("Inferring TZCYX from shape")
-                    axes = "TZCYX"
+    # Lazy zarr-backed views (e.g. whole-slide pyramid levels) are
+    # materialized here, at write time, not at load time
+    if not isinstance(image_data, np.ndarray) and not hasattr(
+        image_data, "compute"
+    ):
+        image_data = np.asarray(image_data)
 
-            if axes and axes != imagej_order:
-                print(f"Reordering: {axes} -> {imagej_order}")
+    # Handle Dask arrays: small ones are materialized here, large ones
+    # stay lazy and are streamed plane by plane further down
+    if hasattr(image_data, "compute") and not use_bigtiff:
+        print("Computing Dask array before saving")
+        try:
+            # Convert to numpy array in memory
+            image_data = image_data.compute()
+        except (MemoryError, ValueError) as e:
+            print(f"Error computing dask array: {e}")
+            raise
+
+    # Basic save if no metadata
+    if metadata is None:
+        print("No metadata provided, using basic save")
+        # Tiling splits each plane into independently compressed
+        # segments, which is what lets maxworkers parallelize encoding
+        tifffile.imwrite(
+            output_path,
+            image_data,
+            compression="zlib",
+            compressionargs={"level": 6},
+            tile=(256, 256),
+            bigtiff=use_bigtiff,
+            maxworkers=os.cpu_count(),
+        )
+        return
 
-                # Map dimensions from original to target order
-                dim_map = {}
-                for i, ax in enumerate(axes):
-                    if ax in imagej_order:
-                        dim_map[ax] = i
+    # Get image dimensions and axis order
+    ndim = len(image_data.shape)
+    axes = metadata.get("axes", "")
 
-                # Handle missing dimensions
-                for ax in imagej_order:
-                    if ax not in dim_map:
-                        print(f"Adding missing dimension: {ax}")
-                        image_data = np.expand_dims(image_data, axis=0)
-                        dim_map[ax] = image_data.shape[0] - 1
+    print(f"Number of dimensions: {ndim}")
+    if axes:
+        print(f"Axes from metadata: {axes}")
 
-                # Create reordering indices
-                source_idx = [dim_map[ax] for ax in imagej_order]
-                target_idx = list(range(len(imagej_order)))
+    # Handle ImageJ compatibility for dimensions
+    if ndim > 2:
+        # Get target order for ImageJ
+        imagej_order = "TZCYX"
 
-                print(f"Reordering dimensions: {source_idx} -> {target_idx}")
+        # If axes information is incomplete, try to infer from shape
+        if len(axes) != ndim:
+            print(
+                f"Warning: Axes length ({len(axes)}) doesn't match dimensions ({ndim})"
+            )
+            # For your specific case with shape (45, 101, 4, 1024, 1024)
+            # Infer TZCYX if shape matches
+            if (
+                ndim == 5
+                and image_data.shape[2] <= 10
+                and image_data.shape[3] > 100
+                and image_data.shape[4] > 100
+            ):
+                print("Inferring TZCYX from shape")
+                axes = "TZCYX"
 
-                # Reorder dimensions
-                try:
-                    image_data = np.moveaxis(
-                        image_data, source_idx, target_idx
-                    )
-                except (ValueError, IndexError) as e:
-                    print(f"Error reordering dimensions: {e}")
-                    # Fall back to simple save without reordering
-                    tifffile.imwrite(
-                        output_path,
-                        image_data,
-                        compression="zlib",
-                        bigtiff=use_bigtiff,
-                    )
-                    return
+        if axes and axes != imagej_order:
+            print(f"Reordering: {axes} -> {imagej_order}")
 
-                # Update axes information
-                metadata["axes"] = imagej_order
+            # Map dimensions from original to target order
+            dim_map = {}
+            for i, ax in enumerate(axes):
+                if ax in imagej_order:
+                    dim_map[ax] = i
 
-        # Extract resolution information for ImageJ
-        resolution = None
-        if "resolution" in metadata:
-            try:
-                res_x, res_y = metadata["resolution"]
-                resolution = (float(res_x), float(res_y))
-                print(f"Using resolution: {resolution}")
-            except (ValueError, TypeError) as e:
-                print(f"Error processing resolution: {e}")
+            # Handle missing dimensions
+            for ax in imagej_order:
+                if ax not in dim_map:
+                    print(f"Adding missing dimension: {ax}")
+                    image_data = np.expand_dims(image_data, axis=0)
+                    dim_map[ax] = image_data.shape[0] - 1
 
-        # Handle saving with metadata
-        try:
-            if ndim <= 2:
-                # 2D case - simpler saving
-                print("Saving as 2D image")
-                tifffile.imwrite(
-                    output_path,
-                    image_data,
-                    resolution=resolution,
-                    compression="zlib",
-                    bigtiff=use_bigtiff,
-                )
-            else:
-                # Hyperstack case
-                print("Saving as hyperstack with ImageJ metadata")
+            # Create reordering indices
+            source_idx = [dim_map[ax] for ax in imagej_order]
+            target_idx = list(range(len(imagej_order)))
 
-                # Create clean metadata dict with only needed keys
-                imagej_metadata = {}
-                if "unit" in metadata:
-                    imagej_metadata["unit"] = metadata["unit"]
-                if "spacing" in metadata:
-                    imagej_metadata["spacing"] = float(metadata["spacing"])
+            print(f"Reordering dimensions: {source_idx} -> {target_idx}")
 
+            # Reorder dimensions
+            try:
+                image_data = np.moveaxis(image_data, source_idx, target_idx)
+            except (ValueError, IndexError) as e:
+                print(f"Error reordering dimensions: {e}")
+                # Fall back to simple save without reordering
                 tifffile.imwrite(
                     output_path,
                     image_data,
-                    imagej=True,
-                    resolution=resolution,
-                    metadata=imagej_metadata,
                     compression="zlib",
                     bigtiff=use_bigtiff,
                 )
+                return
 
-            print(f"Successfully saved TIF file: {output_path}")
-        except (ValueError, FileNotFoundError) as e:
-            print(f"Error saving TIF file: {e}")
-            # Try simple save as fallback
-            tifffile.imwrite(output_path, image_data, bigtiff=use_bigtiff)
+            # Update axes information
+            metadata["axes"] = imagej_order
 
-    def _save_zarr(
-        self, image_data: np.ndarray, output_path: str, metadata: dict = None
-    ):
-        """Enhanced ZARR saving with proper metadata storage and specific exceptions"""
-        print(f"Saving ZARR file: {output_path}")
-        print(f"Image data shape: {image_data.shape}")
+    # Extract resolution information for ImageJ
+    resolution = None
+    if "resolution" in metadata:
+        try:
+            res_x, res_y = metadata["resolution"]
+            resolution = (float(res_x), float(res_y))
+            print(f"Using resolution: {resolution}")
+        except (ValueError, TypeError) as e:
+            print(f"Error processing resolution: {e}")
+
+    # Handle saving with metadata
+    try:
+        if ndim <= 2:
+            # 2D case - simpler saving
+            print("Saving as 2D image")
+            tifffile.imwrite(
+                output_path,
+                image_data,
+                resolution=resolution,
+                compression="zlib",
+                compressionargs={"level": 6},
+                tile=(256, 256),
+                bigtiff=use_bigtiff,
+                maxworkers=os.cpu_count(),
+            )
+        elif use_bigtiff:
+            # BigTIFF cannot carry ImageJ metadata anyway; stream the
+            # planes instead of encoding the full array in memory
+            print("Saving as BigTIFF, streaming plane by plane")
+            _write_tif_planes(image_data, output_path, resolution=resolution)
+        else:
+            # Hyperstack case
+            print("Saving as hyperstack with ImageJ metadata")
 
-        metadata = metadata or {}
-        print(
-            f"Metadata keys: {list(metadata.keys()) if metadata else 'No metadata'}"
-        )
+            # Create clean metadata dict with only needed keys
+            imagej_metadata = {}
+            if "unit" in metadata:
+                imagej_metadata["unit"] = metadata["unit"]
+            if "spacing" in metadata:
+                imagej_metadata["spacing"] = float(metadata["spacing"])
+
+            tifffile.imwrite(
+                output_path,
+                image_data,
+                imagej=True,
+                resolution=resolution,
+                metadata=imagej_metadata,
+                compression="zlib",
+                bigtiff=use_bigtiff,
+                maxworkers=os.cpu_count(),
+            )
 
-        # Handle overwriting by deleting the directory if it exists
-        if os.path.exists(output_path):
-            print(f"Deleting existing Zarr directory: {output_path}")
-            shutil.rmtree(output_path)
+        print(f"Successfully saved TIF file: {output_path}")
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error saving TIF file: {e}")
+        # Try simple save as fallback
+        tifffile.imwrite(output_path, image_data, bigtiff=use_bigtiff)
 
-        # Explicitly create a DirectoryStore
-        store = parse_url(output_path, mode="w").store
 
-        ndim = len(image_data.shape)
+def _calculate_chunks(
+    shape: Tuple[int, ...], itemsize: int, target_bytes: int = 16 * 1024**2
+) -> Tuple[int, ...]:
+    """Pick a chunk shape of roughly target_bytes.
 
-        axes = metadata.get("axes").lower() if metadata else None
+    Fills from the innermost dimensions outward so chunks stay contiguous
+    in memory order.
+    """
+    ndim = len(shape)
+    sizes = np.maximum(np.asarray(shape, dtype=np.int64), 1)
+    elements_per_chunk = max(1, target_bytes // itemsize)
+
+    # Cumulative product of dimension sizes from the innermost axis out;
+    # its insertion point for the element budget tells how many trailing
+    # dimensions fit into a chunk whole
+    cum = np.cumprod(sizes[::-1])
+    k = int(np.searchsorted(cum, elements_per_chunk, side="right"))
+
+    chunks = np.ones(ndim, dtype=np.int64)
+    if k > 0:
+        chunks[ndim - k :] = sizes[ndim - k :]
+    if k < ndim:
+        # Spend the remaining budget on the first partially-filled axis
+        inner_elements = int(cum[k - 1]) if k > 0 else 1
+        chunks[ndim - k - 1] = max(1, elements_per_chunk // inner_elements)
+
+    return tuple(int(c) for c in np.minimum(chunks, sizes))
+
+
+def _save_zarr(
+    image_data: np.ndarray, output_path: str, metadata: dict = None
+):
+    """Enhanced ZARR saving with proper metadata storage and specific exceptions"""
+    print(f"Saving ZARR file: {output_path}")
+    print(f"Image data shape: {image_data.shape}")
+
+    metadata = metadata or {}
+    print(
+        f"Metadata keys: {list(metadata.keys()) if metadata else 'No metadata'}"
+    )
 
-        # Standardize axes order to 'ctzyx' if possible, regardless of Z presence
-        target_axes = "tczyx"
-        if axes != target_axes[:ndim]:
-            print(f"Reordering axes from {axes} to {target_axes[:ndim]}")
-            try:
-                # Create a mapping from original axes to target axes
-                axes_map = {ax: i for i, ax in enumerate(axes)}
-                reorder_list = []
-                for _i, target_ax in enumerate(target_axes[:ndim]):
-                    if target_ax in axes_map:
-                        reorder_list.append(axes_map[target_ax])
-                    else:
-                        print(f"Axis {target_ax} not found in original axes")
-                        reorder_list.append(None)
+    # Handle overwriting by deleting the directory if it exists
+    if os.path.exists(output_path):
+        print(f"Deleting existing Zarr directory: {output_path}")
+        shutil.rmtree(output_path)
 
-                # Filter out None values (missing axes)
-                reorder_list = [i for i in reorder_list if i is not None]
+    # Explicitly create a DirectoryStore; on Linux with liburing available,
+    # batch chunk writes through io_uring instead of one syscall per chunk
+    if HAS_LIBURING:
+        store = IoUringDirectoryStore(output_path)
+    else:
+        store = parse_url(output_path, mode="w").store
 
-                if len(reorder_list) != len(axes):
-                    raise ValueError(
-                        "Reordering failed: Mismatch between original and reordered dimensions."
-                    )
-                image_data = np.moveaxis(
-                    image_data, range(len(axes)), reorder_list
-                )
-                axes = "".join(
-                    [axes[i] for i in reorder_list]
-                )  # Update axes to reflect new order
-                print(f"New axes order after reordering: {axes}")
-            except (ValueError, IndexError) as e:
-                print(f"Error during reordering: {e}")
-                raise
+    # Lazy zarr-backed views are materialized here, at write time
+    if not isinstance(image_data, np.ndarray) and not hasattr(
+        image_data, "compute"
+    ):
+        image_data = np.asarray(image_data)
 
-        # Convert to Dask array
-        if not hasattr(image_data, "dask"):
-            print("Converting to dask array with auto chunks...")
-            image_data = da.from_array(image_data, chunks="auto")
-        else:
-            print("Using existing dask array")
+    ndim = len(image_data.shape)
+
+    axes = metadata.get("axes").lower() if metadata else None
 
-        # Write the image data as OME-Zarr
+    # Standardize axes order to 'ctzyx' if possible, regardless of Z presence
+    target_axes = "tczyx"
+    if axes != target_axes[:ndim]:
+        print(f"Reordering axes from {axes} to {target_axes[:ndim]}")
         try:
-            print("Writing image data using ome_zarr.writer.write_image...")
-            with ProgressBar():
-                root = zarr.group(store=store)
-                write_image(
-                    image_data,
-                    group=root,
-                    axes=axes,
-                    scaler=None,
-                    storage_options={"compression": "zstd"},
-                )
+            # Create a mapping from original axes to target axes
+            axes_map = {ax: i for i, ax in enumerate(axes)}
+            reorder_list = []
+            for _i, target_ax in enumerate(target_axes[:ndim]):
+                if target_ax in axes_map:
+                    reorder_list.append(axes_map[target_ax])
+                else:
+                    print(f"Axis {target_ax} not found in original axes")
+                    reorder_list.append(None)
 
-            # Add basic OME-Zarr metadata
-            root = zarr.open(store)
-            root.attrs["multiscales"] = [
-                {
-                    "version": "0.4",
-                    "datasets": [{"path": "0"}],
-                    "axes": [
-                        {
-                            "name": ax,
-                            "type": (
-                                "space"
-                                if ax in "xyz"
-                                else "time" if ax == "t" else "channel"
-                            ),
-                        }
-                        for ax in axes
-                    ],
-                }
-            ]
+            # Filter out None values (missing axes)
+            reorder_list = [i for i in reorder_list if i is not None]
 
-            print("OME-Zarr file saved successfully.")
-            return True
+            if len(reorder_list) != len(axes):
+                raise ValueError(
+                    "Reordering failed: Mismatch between original and reordered dimensions."
+                )
+            image_data = np.moveaxis(
+                image_data, range(len(axes)), reorder_list
+            )
+            axes = "".join(
+                [axes[i] for i in reorder_list]
+            )  # Update axes to reflect new order
+            print(f"New axes order after reordering: {axes}")
+        except (ValueError, IndexError) as e:
+            print(f"Error during reordering: {e}")
+            raise
+
+    # Write the image data as a single-scale OME-Zarr: create the array
+    # directly and assign the data in one slab instead of going through
+    # ome_zarr.writer.write_image, which materializes the full array,
+    # builds pyramids and passes through several Python layers that a
+    # plain single-scale conversion does not need
+    try:
+        chunks = _calculate_chunks(image_data.shape, image_data.itemsize)
+        print(f"Writing image data to zarr with chunks {chunks}...")
+
+        # Let Blosc compress each chunk with its internal thread pool
+        numcodecs.blosc.use_threads = True
+
+        root = zarr.group(store=store)
+        zarr_array = root.create_dataset(
+            "0",
+            shape=image_data.shape,
+            chunks=chunks,
+            dtype=image_data.dtype,
+            compressor=_ZARR_COMPRESSOR,
+        )
+        if hasattr(image_data, "dask"):
+            # Dask arrays stream block by block into the store
+            da.store(image_data, zarr_array)
+        else:
+            zarr_array[:] = image_data
+
+        # Make sure all batched chunk writes have hit the disk
+        if hasattr(store, "flush"):
+            store.flush()
+
+        # Add basic OME-Zarr metadata
+        root.attrs["multiscales"] = [
+            {
+                "version": "0.4",
+                "datasets": [{"path": "0"}],
+                "axes": [
+                    {
+                        "name": ax,
+                        "type": (
+                            "space"
+                            if ax in "xyz"
+                            else "time" if ax == "t" else "channel"
+                        ),
+                    }
+                    for ax in axes
+                ],
+            }
+        ]
 
-        except (ValueError, FileNotFoundError) as e:
-            print(f"Error during Zarr writing: {e}")
-            import traceback
+        print("OME-Zarr file saved successfully.")
+        return True
 
-            traceback.print_exc()
-            return False
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error during Zarr writing: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
 
 
 class MicroscopyImageConverterWidget(QWidget):
@@ -1469,6 +2669,7 @@ class MicroscopyImageConverterWidget(QWidget):
 
         # Working threads
         self.scan_worker = None
+        self.probe_worker = None
         self.conversion_worker = None
 
         # Flag to prevent recursive radio button updates
@@ -1578,10 +2779,14 @@ class MicroscopyImageConverterWidget(QWidget):
         self.status_label = QLabel("")
         main_layout.addWidget(self.status_label)
 
+    def __del__(self):
+        # Release the memoized file readers held by the cached openers
+        close_cached_readers()
+
     def cancel_operation(self):
         """Cancel current operation"""
         if self.scan_worker and self.scan_worker.isRunning():
-            self.scan_worker.terminate()
+            self.scan_worker.stop()
             self.scan_worker = None
             self.status_label.setText("Scanning cancelled")
 
@@ -1590,6 +2795,7 @@ class MicroscopyImageConverterWidget(QWidget):
             self.status_label.setText("Conversion cancelled")
 
         self.scan_progress.setVisible(False)
+        self.scan_progress.setRange(0, 100)
         self.conversion_progress.setVisible(False)
         self.cancel_button.setVisible(False)
 
@@ -1619,9 +2825,10 @@ class MicroscopyImageConverterWidget(QWidget):
         if not filters:
             filters = [".lif", ".nd2", ".ndpi", ".czi"]
 
-        # Clear existing files
-        self.files_table.setRowCount(0)
-        self.files_table.file_data.clear()
+        # Clear existing files and drop previewed series so the cache
+        # does not pin stale multi-GB arrays across rescans
+        self.files_table.clear_files()
+        _cached_load_series.cache_clear()
 
         # Set up and start the worker thread
         self.scan_worker = ScanFolderWorker(folder, filters)
@@ -1629,95 +2836,72 @@ class MicroscopyImageConverterWidget(QWidget):
         self.scan_worker.finished.connect(self.process_found_files)
         self.scan_worker.error.connect(self.show_error)
 
-        # Show progress bar and start worker
+        # Show progress bar and start worker; the total is unknown while
+        # the tree is being walked, so the bar runs indeterminate
         self.scan_progress.setVisible(True)
-        self.scan_progress.setValue(0)
+        self.scan_progress.setRange(0, 0)
         self.cancel_button.setVisible(True)
         self.status_label.setText("Scanning folder...")
         self.scan_worker.start()
 
-    def update_scan_progress(self, current, total):
-        """Update the scan progress bar"""
-        if total > 0:
-            self.scan_progress.setValue(int(current * 100 / total))
+    def update_scan_progress(self, count):
+        """Show the running file count while the scan total is unknown"""
+        self.status_label.setText(f"Scanning folder... {count} files found")
 
     def process_found_files(self, found_files):
         """Process the list of found files after scanning is complete"""
-        # Hide progress bar
+        # Hide progress bar and restore its determinate range
         self.scan_progress.setVisible(False)
+        self.scan_progress.setRange(0, 100)
         self.cancel_button.setVisible(False)
 
-        # Process files
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # Process files in parallel to get series counts
-            futures = {}
-            for filepath in found_files:
-                file_type = self.get_file_type(filepath)
-                if file_type:
-                    loader = self.get_file_loader(filepath)
-                    if loader:
-                        future = executor.submit(
-                            loader.get_series_count, filepath
-                        )
-                        futures[future] = (filepath, file_type)
-
-            # Process results as they complete
-            file_count = len(found_files)
-            processed = 0
-
-            for i, future in enumerate(
-                concurrent.futures.as_completed(futures)
-            ):
-                processed = i + 1
-                filepath, file_type = futures[future]
+        files_and_types = [
+            (filepath, self.get_file_type(filepath), mtime_ns, size)
+            for filepath, mtime_ns, size in found_files
+        ]
 
-                try:
-                    series_count = future.result()
-                    # Add file to table
-                    self.files_table.add_file(
-                        filepath, file_type, series_count
-                    )
-                except (ValueError, FileNotFoundError) as e:
-                    print(f"Error processing {filepath}: {str(e)}")
-                    # Add file with error indication
-                    self.files_table.add_file(filepath, file_type, -1)
-
-                # Update status periodically
-                if processed % 5 == 0 or processed == file_count:
-                    self.status_label.setText(
-                        f"Processed {processed}/{file_count} files..."
-                    )
-                    QApplication.processEvents()
+        # Probe off the GUI thread; results arrive as queued signals so
+        # the event loop stays responsive without manual pumping
+        self.probe_worker = ProbeWorker(files_and_types)
+        self.probe_worker.file_probed.connect(self.files_table.add_file)
+        self.probe_worker.status.connect(self.status_label.setText)
+        self.probe_worker.finished.connect(self.probing_finished)
+        self.probe_worker.error.connect(self.show_error)
+        self.probe_worker.start()
 
-        self.status_label.setText(f"Found {len(found_files)} files")
+    def probing_finished(self, file_count: int):
+        """Finalize the table once all series counts are in"""
+        self.files_table.flush_pending()
+        self.status_label.setText(f"Found {file_count} files")
 
     def show_error(self, error_message):
         """Show error message"""
         self.status_label.setText(f"Error: {error_message}")
         self.scan_progress.setVisible(False)
+        self.scan_progress.setRange(0, 100)
         self.cancel_button.setVisible(False)
         QMessageBox.critical(self, "Error", error_message)
 
     def get_file_type(self, filepath: str) -> str:
         """Determine the file type based on extension or directory type"""
+        # Extension first: a known suffix settles the type without the
+        # stat that the directory check below costs
+        ext = os.path.splitext(filepath)[1].lower()
+        file_type = _EXT_TO_TYPE.get(ext)
+        if file_type is not None:
+            return file_type
         if os.path.isdir(filepath) and AcquiferLoader.can_load(filepath):
             return "Acquifer"
-        ext = filepath.lower()
-        if ext.endswith(".lif"):
-            return "LIF"
-        elif ext.endswith(".nd2"):
-            return "ND2"
-        elif ext.endswith((".ndpi", ".svs")):
-            return "Slide"
-        elif ext.endswith(".czi"):
-            return "CZI"
         return "Unknown"
 
     def get_file_loader(self, filepath: str) -> Optional[FormatLoader]:
         """Get the appropriate loader for the file type"""
-        for loader in self.loaders:
-            if loader.can_load(filepath):
-                return loader
+        ext = os.path.splitext(filepath)[1].lower()
+        loader = _EXT_TO_LOADER.get(ext)
+        if loader is not None:
+            return loader
+        if os.path.isdir(filepath) and AcquiferLoader.can_load(filepath):
+            return AcquiferLoader
         return None
 
     def show_series_details(self, filepath: str):
@@ -1767,15 +2951,13 @@ class MicroscopyImageConverterWidget(QWidget):
             self.status_label.setText("Please specify an output folder")
             return False
 
-        # Check if folder exists, if not try to create it
-        if not os.path.exists(folder):
-            try:
-                os.makedirs(folder)
-            except (FileNotFoundError, PermissionError) as e:
-                self.status_label.setText(
-                    f"Cannot create output folder: {str(e)}"
-                )
-                return False
+        # Create the folder if needed; exist_ok skips the separate
+        # existence stat and is free of the check-then-create race
+        try:
+            os.makedirs(folder, exist_ok=True)
+        except OSError as e:
+            self.status_label.setText(f"Cannot create output folder: {str(e)}")
+            return False
 
         # Check if folder is writable
         if not os.access(folder, os.W_OK):
@@ -1800,6 +2982,16 @@ class MicroscopyImageConverterWidget(QWidget):
         if not self.is_output_folder_valid(output_folder):
             return
 
+        # Only selections marked "export all series" need expanding; a
+        # plain selection is handed to the worker as the mapping itself,
+        # skipping the copy into a list of pairs
+        if not any(
+            self.export_all_series.get(filepath, False)
+            for filepath in self.selected_series
+        ):
+            self.start_conversion_worker(self.selected_series, output_folder)
+            return
+
         # Create files to convert list
         files_to_convert = []
 
@@ -1831,7 +3023,16 @@ class MicroscopyImageConverterWidget(QWidget):
             self.status_label.setText("No valid files to convert")
             return
 
-        # Set up and start the conversion worker thread
+        self.start_conversion_worker(files_to_convert, output_folder)
+
+    def start_conversion_worker(self, files_to_convert, output_folder):
+        """Set up and start the conversion worker thread"""
+        # Snapshot mappings here: the worker iterates on its own thread
+        # while the UI stays live, so handing it the selection dict
+        # itself would let a click mid-conversion mutate the iteration
+        if hasattr(files_to_convert, "items"):
+            files_to_convert = list(files_to_convert.items())
+
         self.conversion_worker = ConversionWorker(
             files_to_convert=files_to_convert,
             output_folder=output_folder,
@@ -1885,6 +3086,10 @@ class MicroscopyImageConverterWidget(QWidget):
         self.conversion_progress.setVisible(False)
         self.cancel_button.setVisible(False)
 
+        # Release the reader handles held for previews; the converted
+        # files are on disk and the sources may be unmounted next
+        close_cached_readers()
+
         output_folder = self.output_edit.text()
         if not output_folder:
             output_folder = os.path.join(self.folder_edit.text(), "converted")
@@ -0,0 +1,155 @@
+# src/napari_tmidas/_tests/test_file_conversion.py
+from math import prod
+
+from napari_tmidas._file_conversion import (
+    LIFLoader,
+    _calculate_chunks,
+    _FileTableModel,
+    _ReaderCache,
+    _SeriesCountCache,
+)
+
+
+class _FakeImage:
+    """Minimal stand-in for a readlif image"""
+
+    def __init__(self, nt, nz, channels, x, y):
+        self.nt = nt
+        self.nz = nz
+        self.channels = channels
+        self.dims = (x, y)
+
+
+class _FakeReader:
+    """Reader double that records whether it was closed"""
+
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestCalculateChunks:
+    def test_fills_innermost_dimensions_first(self):
+        """Chunks grow from the fastest-varying axes outward"""
+        chunks = _calculate_chunks((45, 101, 4, 1024, 1024), itemsize=2)
+        assert chunks == (1, 2, 4, 1024, 1024)
+
+    def test_small_array_is_a_single_chunk(self):
+        shape = (4, 64, 64)
+        assert _calculate_chunks(shape, itemsize=2) == shape
+
+    def test_chunks_never_exceed_shape(self):
+        chunks = _calculate_chunks((3, 10, 10), itemsize=8, target_bytes=10**9)
+        assert chunks == (3, 10, 10)
+
+    def test_chunk_stays_within_byte_budget(self):
+        target = 16 * 1024**2
+        chunks = _calculate_chunks(
+            (2, 100_000, 100_000), itemsize=2, target_bytes=target
+        )
+        assert prod(chunks) * 2 <= target
+        # The innermost axis is kept whole
+        assert chunks[-1] == 100_000
+
+
+class TestSeriesCountCache:
+    def test_round_trip(self, tmp_path):
+        cache = _SeriesCountCache(str(tmp_path / "counts.sqlite"))
+        cache.put("/data/a.lif", 111, 222, 5)
+        assert cache.get("/data/a.lif", 111, 222) == 5
+        cache.close()
+
+    def test_mtime_or_size_mismatch_is_a_miss(self):
+        """Entries are invalidated by the (mtime, size) part of the key"""
+        cache = _SeriesCountCache(":memory:")
+        cache.put("/data/a.lif", 111, 222, 5)
+        assert cache.get("/data/a.lif", 999, 222) is None
+        assert cache.get("/data/a.lif", 111, 999) is None
+        assert cache.get("/data/b.lif", 111, 222) is None
+        cache.close()
+
+    def test_put_replaces_stale_entry(self):
+        cache = _SeriesCountCache(":memory:")
+        cache.put("/data/a.lif", 111, 222, 5)
+        cache.put("/data/a.lif", 333, 444, 7)
+        assert cache.get("/data/a.lif", 111, 222) is None
+        assert cache.get("/data/a.lif", 333, 444) == 7
+        cache.close()
+
+    def test_persists_across_connections(self, tmp_path):
+        path = str(tmp_path / "counts.sqlite")
+        cache = _SeriesCountCache(path)
+        cache.put("/data/a.lif", 111, 222, 5)
+        cache.close()
+
+        reopened = _SeriesCountCache(path)
+        assert reopened.get("/data/a.lif", 111, 222) == 5
+        reopened.close()
+
+
+class TestReaderCache:
+    def test_same_path_returns_same_reader(self):
+        cache = _ReaderCache(_FakeReader, maxsize=2)
+        assert cache("a") is cache("a")
+
+    def test_evicts_and_closes_least_recently_used(self):
+        cache = _ReaderCache(_FakeReader, maxsize=2)
+        reader_a = cache("a")
+        reader_b = cache("b")
+        cache("a")  # touch a, so b becomes least recently used
+        reader_c = cache("c")
+
+        assert reader_b.closed
+        assert not reader_a.closed
+        assert not reader_c.closed
+        assert cache("a") is reader_a
+
+    def test_close_all(self):
+        cache = _ReaderCache(_FakeReader, maxsize=4)
+        readers = [cache(path) for path in "abc"]
+        cache._close_all()
+        assert all(reader.closed for reader in readers)
+        # The cache is usable afterwards and re-opens from scratch
+        assert cache("a") is not readers[0]
+
+
+class TestSeriesLayout:
+    def test_drops_singleton_axes(self):
+        image = _FakeImage(nt=1, nz=5, channels=2, x=64, y=32)
+        axes, shape = LIFLoader._series_layout(image)
+        assert axes == "ZCYX"
+        assert shape == (5, 2, 32, 64)
+
+    def test_always_keeps_yx(self):
+        image = _FakeImage(nt=1, nz=1, channels=1, x=64, y=32)
+        axes, shape = LIFLoader._series_layout(image)
+        assert axes == "YX"
+        assert shape == (32, 64)
+
+    def test_full_series_keeps_all_axes(self):
+        image = _FakeImage(nt=3, nz=5, channels=2, x=64, y=32)
+        axes, shape = LIFLoader._series_layout(image)
+        assert axes == "TZCYX"
+        assert shape == (3, 5, 2, 32, 64)
+
+
+class TestFileTableModel:
+    def test_append_rows_and_display(self):
+        model = _FileTableModel()
+        model.append_rows([("/data/x.lif", 3), ("/data/y.nd2", -1)])
+
+        assert model.rowCount() == 2
+        assert model.columnCount() == 2
+        assert model.data(model.index(0, 0)) == "x.lif"
+        assert model.data(model.index(0, 1)) == "3 series"
+        assert model.data(model.index(1, 1)) == "Not a series file"
+        assert model.filepath_at(1) == "/data/y.nd2"
+
+    def test_clear(self):
+        model = _FileTableModel()
+        model.append_rows([("/data/x.lif", 3)])
+        model.clear()
+        assert model.rowCount() == 0